@@ -18,8 +18,12 @@ from .exceptions import (
     SourceReadError,
 )
 from .extractor import (
+    Compression,
     ExtractionResult,
     OutputType,
+    download_source,
+    export_to_duckdb,
+    extract_organizational_and_aggregates,
     extract_organizational_contributions,
     extract_raw_organizational_contributions,
     extract_recipient_aggregates,
@@ -39,8 +43,12 @@ __all__ = [
     # Extraction functions
     "extract_organizational_contributions",
     "extract_recipient_aggregates",
+    "extract_organizational_and_aggregates",
     "extract_raw_organizational_contributions",
+    "download_source",
+    "export_to_duckdb",
     # Result types
+    "Compression",
     "ExtractionResult",
     "OutputType",
     "ValidationResult",
@@ -3,24 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import io
 import logging
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from .exceptions import ContributionFilterError
 from .extractor import (
+    Compression,
+    download_source,
+    export_to_duckdb,
+    extract_organizational_and_aggregates,
     extract_organizational_contributions,
     extract_raw_organizational_contributions,
     extract_recipient_aggregates,
 )
 from .schema import (
     ALL_CYCLES,
+    ALLOWED_LOCAL_DIRECTORIES,
     MAX_CYCLE,
     MIN_CYCLE,
     get_organizational_filename,
     get_raw_organizational_filename,
     get_recipient_aggregates_filename,
+    validate_cycle,
 )
 
 logger = logging.getLogger(__name__)
@@ -28,6 +38,11 @@ logger = logging.getLogger(__name__)
 
 def _setup_logging() -> None:
     """Configure logging for CLI usage."""
+    # Keep progress output timely when piped (e.g. `| tee log`), where stdout
+    # would otherwise be block-buffered
+    for stream in (sys.stdout, sys.stderr):
+        if isinstance(stream, io.TextIOWrapper):
+            stream.reconfigure(line_buffering=True)
     logging.basicConfig(
         level=logging.INFO,
         format="%(message)s",
@@ -120,6 +135,47 @@ Examples:
         dest="skip_existing",
         help="Skip files that already exist",
     )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help=(
+            "Stage each source file in a local DuckDB temp table before querying it "
+            "(fewer remote reads; --output-type all always reads the source once)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        dest="cache_dir",
+        help=(
+            "Download each source file into this directory once and read it locally "
+            "(reused by later runs; must be under /tmp/ or DIME_ALLOWED_DIRS)"
+        ),
+    )
+    parser.add_argument(
+        "--duckdb-output",
+        action="store_true",
+        dest="duckdb_output",
+        help=(
+            "Also write recipient aggregates to a native DuckDB database "
+            "(recipient_aggregates_<cycle>.duckdb) for faster DuckDB queries"
+        ),
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["zstd", "zstd-fast", "lz4-raw"],
+        default="zstd",
+        help=(
+            "Parquet compression for outputs (default: zstd). 'zstd-fast' and "
+            "'lz4-raw' write faster but produce larger files."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of cycles to extract concurrently (default: 1)",
+    )
     parser.add_argument(
         "--delay",
         type=int,
@@ -134,7 +190,7 @@ Examples:
     if args.cycle:
         cycles = [args.cycle]
     elif args.all:
-        cycles = ALL_CYCLES
+        cycles = list(ALL_CYCLES)
     elif args.start_cycle:
         if not args.end_cycle:
             print("ERROR: --start-cycle requires --end-cycle", file=sys.stderr)
@@ -150,9 +206,16 @@ Examples:
         print("ERROR: --sample-size must be a positive integer", file=sys.stderr)
         return 1
 
+    if args.workers <= 0:
+        print("ERROR: --workers must be a positive integer", file=sys.stderr)
+        return 1
+    if args.workers > 1 and args.delay > 0:
+        print("ERROR: --delay cannot be combined with --workers", file=sys.stderr)
+        return 1
+
     # Validate cycles are in range
     for c in cycles:
-        if c not in ALL_CYCLES:
+        if not validate_cycle(c):
             print(
                 f"ERROR: Invalid cycle {c} (must be even year {MIN_CYCLE}-{MAX_CYCLE})",
                 file=sys.stderr,
@@ -175,6 +238,14 @@ Examples:
         )
         return 1
 
+    # Cached sources are read back through the local-path allowlist
+    if args.cache_dir and not f"{args.cache_dir.resolve()}/".startswith(ALLOWED_LOCAL_DIRECTORIES):
+        print(
+            f"ERROR: --cache-dir must be within an allowed directory: {args.cache_dir}",
+            file=sys.stderr,
+        )
+        return 1
+
     logger.info("[%s] Processing %d cycle(s)", datetime.now().isoformat(), len(cycles))
     logger.info("  Output directory: %s", args.output_dir)
     logger.info("  Output type: %s", args.output_type)
@@ -183,96 +254,46 @@ Examples:
     logger.info("  Validation: %s", "disabled" if args.no_validate else "enabled")
     if args.skip_existing:
         logger.info("  Skip existing: enabled")
+    if args.prefetch:
+        logger.info("  Prefetch: enabled")
+    if args.cache_dir:
+        logger.info("  Source cache: %s", args.cache_dir)
+    if args.duckdb_output:
+        logger.info("  DuckDB output: enabled")
+    if args.compression != "zstd":
+        logger.info("  Compression: %s", args.compression)
+    if args.workers > 1:
+        logger.info("  Workers: %d", args.workers)
     if args.delay > 0:
         logger.info("  Delay between cycles: %ds", args.delay)
 
-    success_count = 0
-    error_count = 0
-    skip_count = 0
-
-    for i, cycle in enumerate(cycles):
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info("Cycle: %d", cycle)
-        logger.info("=" * 60)
-
-        try:
-            cycle_did_work = False
-
-            # Organizational contributions
-            if args.output_type in ("organizational", "all"):
-                output_path = (
-                    args.output_dir / "organizational" / get_organizational_filename(cycle)
-                )
-                if args.skip_existing and output_path.exists():
-                    logger.info("  Skipping (exists): %s", output_path)
-                else:
-                    result = extract_organizational_contributions(
-                        output_path,
-                        cycle,
-                        legislators_path=args.legislators_path,
-                        validate=not args.no_validate,
-                    )
-                    file_size = result.output_path.stat().st_size
-                    logger.info("  Created: %s", result.output_path)
-                    logger.info("  Size: %s", _format_size(file_size))
-                    cycle_did_work = True
-
-            # Recipient aggregates
-            if args.output_type in ("aggregates", "all"):
-                output_path = (
-                    args.output_dir
-                    / "recipient_aggregates"
-                    / get_recipient_aggregates_filename(cycle)
-                )
-                if args.skip_existing and output_path.exists():
-                    logger.info("  Skipping (exists): %s", output_path)
-                else:
-                    result = extract_recipient_aggregates(
-                        output_path,
-                        cycle,
-                        legislators_path=args.legislators_path,
-                        validate=not args.no_validate,
-                        sample_size=args.sample_size,
-                    )
-                    file_size = result.output_path.stat().st_size
-                    logger.info("  Created: %s", result.output_path)
-                    logger.info("  Size: %s", _format_size(file_size))
-                    cycle_did_work = True
-
-            # Raw organizational contributions (requires legislators_path)
-            if args.output_type in ("raw-organizational", "all") and args.legislators_path:
-                output_path = (
-                    args.output_dir / "raw_organizational" / get_raw_organizational_filename(cycle)
-                )
-                if args.skip_existing and output_path.exists():
-                    logger.info("  Skipping (exists): %s", output_path)
-                else:
-                    result = extract_raw_organizational_contributions(
-                        output_path,
-                        cycle,
-                        args.legislators_path,
-                        validate=not args.no_validate,
-                    )
-                    file_size = result.output_path.stat().st_size
-                    logger.info("  Created: %s", result.output_path)
-                    logger.info("  Size: %s", _format_size(file_size))
-                    cycle_did_work = True
-
-            if cycle_did_work:
-                success_count += 1
-                # Apply delay between cycles (not after the last one)
-                if args.delay > 0 and i < len(cycles) - 1:
-                    import time
-
-                    logger.info("  Waiting %ds before next cycle...", args.delay)
-                    time.sleep(args.delay)
-            else:
-                skip_count += 1
-
-        except ContributionFilterError as e:
-            logger.error("ERROR: %s", e)
-            error_count += 1
+    # With --skip-existing, list each output directory once up front instead of
+    # stat-ing every candidate file per cycle
+    existing: dict[Path, set[str]] = {}
+    if args.skip_existing:
+        for subdir in _OUTPUT_SUBDIRS:
+            directory = args.output_dir / subdir
+            existing[directory] = _list_filenames(directory)
+
+    # Outcome per cycle: True (created outputs), False (all skipped), None (error)
+    outcomes: list[bool | None] = []
+    if args.workers > 1:
+        # Cycles are independent; each worker's extractions get their own cursor
+        # on the shared DuckDB database. No more threads than there are cycles.
+        with ThreadPoolExecutor(max_workers=min(args.workers, len(cycles))) as pool:
+            outcomes = list(pool.map(lambda cycle: _run_cycle(cycle, args, existing), cycles))
+    else:
+        for i, cycle in enumerate(cycles):
+            outcome = _run_cycle(cycle, args, existing)
+            outcomes.append(outcome)
+            # Apply delay between cycles (not after the last one)
+            if outcome and args.delay > 0 and i < len(cycles) - 1:
+                logger.info("  Waiting %ds before next cycle...", args.delay)
+                time.sleep(args.delay)
+
+    success_count = outcomes.count(True)
+    skip_count = outcomes.count(False)
+    error_count = outcomes.count(None)
 
     logger.info("")
     logger.info("[%s] Complete", datetime.now().isoformat())
@@ -286,16 +307,157 @@ Examples:
     return 0
 
 
+# Output subdirectory for each output type, under output_dir
+_OUTPUT_SUBDIRS = ("organizational", "recipient_aggregates", "raw_organizational")
+
+
+def _run_cycle(cycle: int, args: argparse.Namespace, existing: dict[Path, set[str]]) -> bool | None:
+    """Process one cycle, logging (rather than raising) extraction errors.
+
+    Returns:
+        True if any output was created, False if all were skipped, None on error
+    """
+    try:
+        return _process_cycle(cycle, args, existing)
+    except ContributionFilterError as e:
+        logger.error("ERROR: cycle %d: %s", cycle, e)
+        return None
+
+
+def _process_cycle(cycle: int, args: argparse.Namespace, existing: dict[Path, set[str]]) -> bool:
+    """Create the requested outputs for one cycle.
+
+    Returns:
+        True if any output was created, False if all were skipped
+    """
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info("Cycle: %d", cycle)
+    logger.info("=" * 60)
+
+    org_dir, agg_dir, raw_dir = (args.output_dir / subdir for subdir in _OUTPUT_SUBDIRS)
+    compression = Compression[args.compression.upper().replace("-", "_")]
+
+    org_path = org_dir / get_organizational_filename(cycle)
+    agg_path = agg_dir / get_recipient_aggregates_filename(cycle)
+    raw_path = raw_dir / get_raw_organizational_filename(cycle)
+    want_org = args.output_type in ("organizational", "all")
+    want_agg = args.output_type in ("aggregates", "all")
+    want_raw = args.output_type in ("raw-organizational", "all") and bool(args.legislators_path)
+    if want_org and org_path.name in existing.get(org_dir, ()):
+        logger.info("  Skipping (exists): %s", org_path)
+        want_org = False
+    if want_agg and agg_path.name in existing.get(agg_dir, ()):
+        logger.info("  Skipping (exists): %s", agg_path)
+        want_agg = False
+    if want_raw and raw_path.name in existing.get(raw_dir, ()):
+        logger.info("  Skipping (exists): %s", raw_path)
+        want_raw = False
+
+    if not (want_org or want_agg or want_raw):
+        return False
+
+    # Only fetch the source once there is something to extract from it
+    source_url = None
+    if args.cache_dir:
+        source_url = str(download_source(cycle, args.cache_dir))
+
+    # Organizational contributions + recipient aggregates (and raw organizational
+    # contributions, if requested) from one source read
+    if want_org and want_agg:
+        results = extract_organizational_and_aggregates(
+            org_path,
+            agg_path,
+            cycle,
+            source_url=source_url,
+            legislators_path=args.legislators_path,
+            raw_organizational_path=raw_path if want_raw else None,
+            validate=not args.no_validate,
+            sample_size=args.sample_size,
+            compression=compression,
+        )
+        for result in results:
+            _log_created(result.output_path)
+        want_raw = False
+
+    # Organizational contributions
+    elif want_org:
+        result = extract_organizational_contributions(
+            org_path,
+            cycle,
+            source_url=source_url,
+            legislators_path=args.legislators_path,
+            validate=not args.no_validate,
+            prefetch=args.prefetch,
+            compression=compression,
+        )
+        _log_created(result.output_path)
+
+    # Recipient aggregates
+    elif want_agg:
+        result = extract_recipient_aggregates(
+            agg_path,
+            cycle,
+            source_url=source_url,
+            legislators_path=args.legislators_path,
+            validate=not args.no_validate,
+            sample_size=args.sample_size,
+            prefetch=args.prefetch,
+            compression=compression,
+        )
+        _log_created(result.output_path)
+
+    if want_agg and args.duckdb_output:
+        export_to_duckdb(agg_path, agg_path.with_suffix(".duckdb"))
+
+    # Raw organizational contributions on their own (requires legislators_path)
+    if want_raw:
+        result = extract_raw_organizational_contributions(
+            raw_path,
+            cycle,
+            args.legislators_path,
+            source_url=source_url,
+            validate=not args.no_validate,
+            prefetch=args.prefetch,
+            compression=compression,
+        )
+        _log_created(result.output_path)
+
+    return True
+
+
+def _log_created(output_path: Path) -> None:
+    """Log a created output file and its size."""
+    logger.info("  Created: %s", output_path)
+    logger.info("  Size: %s", _format_size(output_path.stat().st_size))
+
+
+def _list_filenames(directory: Path) -> set[str]:
+    """Return the names of files in directory (empty if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+# (suffix, divisor, decimal places) indexed by floor(log1024(size))
+_SIZE_UNITS = (
+    ("B", 1, 0),
+    ("KB", 1024, 1),
+    ("MB", 1024**2, 1),
+    ("GB", 1024**3, 2),
+)
+
+
 def _format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    # bit_length() - 1 is floor(log2(size)); every 10 bits is one 1024x unit step
+    index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    suffix, divisor, places = _SIZE_UNITS[index]
+    if divisor == 1:
+        return f"{size_bytes} {suffix}"
+    return f"{size_bytes / divisor:.{places}f} {suffix}"
 
 
 if __name__ == "__main__":
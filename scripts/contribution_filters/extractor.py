@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import logging
+import shutil
+import threading
+import urllib.request
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from urllib.parse import urlparse
 
 import duckdb
 
@@ -17,16 +21,21 @@ from .exceptions import (
 )
 from .schema import (
     ALLOWED_SOURCE_DOMAINS,
+    BIOGUIDE_LOOKUP_QUERY,
     CONTRIBUTIONS_URL_TEMPLATE,
+    DOWNLOAD_TIMEOUT_SECONDS,
     MAX_CYCLE,
     MIN_CYCLE,
     ORGANIZATIONAL_QUERY,
     ORGANIZATIONAL_QUERY_WITH_BIOGUIDE,
     RAW_ORGANIZATIONAL_CONTRIBUTIONS_QUERY,
+    RAW_ORGANIZATIONAL_SOURCE_COLUMNS,
     RECIPIENT_AGGREGATES_QUERY,
     RECIPIENT_AGGREGATES_QUERY_WITH_BIOGUIDE,
+    RECIPIENT_AGGREGATES_SOURCE_COLUMNS,
     RECIPIENTS_URL,
-    escape_sql_string,
+    SOURCE_TABLE,
+    parquet_scan,
     validate_cycle,
     validate_source_url,
 )
@@ -47,6 +56,14 @@ class OutputType(Enum):
     RAW_ORGANIZATIONAL = "raw_organizational"  # New: detailed org records with bioguide_id
 
 
+class Compression(Enum):
+    """Parquet compression for outputs, as COPY options."""
+
+    ZSTD = "COMPRESSION ZSTD, COMPRESSION_LEVEL 3"  # Default: smallest files
+    ZSTD_FAST = "COMPRESSION ZSTD, COMPRESSION_LEVEL 1"  # Faster writes, slightly larger
+    LZ4_RAW = "COMPRESSION LZ4_RAW"  # Fastest writes and reads, largest files
+
+
 @dataclass
 class ExtractionResult:
     """Result of a successful extraction."""
@@ -60,6 +77,310 @@ class ExtractionResult:
     validation: ValidationResult
 
 
+def _resolve_source_url(cycle: int, source_url: str | None) -> str:
+    """Validate cycle and source URL, returning the source URL to read from."""
+    if not validate_cycle(cycle):
+        raise InvalidCycleError(
+            message=f"Invalid cycle: {cycle}",
+            cycle=cycle,
+            min_cycle=MIN_CYCLE,
+            max_cycle=MAX_CYCLE,
+        )
+
+    source_url = source_url or CONTRIBUTIONS_URL_TEMPLATE.format(cycle=cycle)
+
+    if not validate_source_url(source_url):
+        raise InvalidSourceURLError(
+            message="Source URL must be from an allowed domain",
+            source_url=source_url,
+            allowed_domains=list(ALLOWED_SOURCE_DOMAINS),
+        )
+    return source_url
+
+
+_database: duckdb.DuckDBPyConnection | None = None
+_database_lock = threading.Lock()
+
+
+def _connect() -> duckdb.DuckDBPyConnection:
+    """Open a connection on the shared in-memory DuckDB database.
+
+    Each call returns its own cursor (separate temp tables and transactions),
+    while loaded extensions live on the shared database. The database enables
+    parquet_metadata_cache, so parsed parquet footers are kept and reused by
+    every later read of the same file, and enable_http_metadata_cache, so HTTP
+    HEAD results for remote files are kept too. Both are reused across
+    extractions in a batch run. Closing the returned cursor leaves the shared
+    database open.
+    """
+    global _database
+    with _database_lock:
+        if _database is None:
+            conn = duckdb.connect()
+            # Each extraction reads the same source several times (count, query,
+            # validation); keep HTTP HEAD results and parsed parquet footers
+            # instead of refetching them.
+            conn.execute("SET enable_http_metadata_cache = true")
+            # parquet_metadata_cache is per session; set it globally so cursors inherit it
+            conn.execute("SET GLOBAL parquet_metadata_cache = true")
+            _database = conn
+        return _database.cursor()
+
+
+def _stage_source(
+    conn: duckdb.DuckDBPyConnection,
+    source_url: str,
+    columns: tuple[str, ...] | None = None,
+) -> str:
+    """Copy the source parquet into a temp table so later queries read it locally.
+
+    Args:
+        conn: DuckDB connection that owns the temp table
+        source_url: Validated source URL or path
+        columns: Source columns to keep (default: all). Only these column
+            chunks are fetched from the source.
+
+    Returns:
+        Name of the staged table, for use as a query template's {source}
+    """
+    logger.info("Staging source locally...")
+    select_list = ", ".join(f'"{c}"' for c in columns) if columns else "*"
+    conn.execute(f"""
+        CREATE TEMP TABLE {SOURCE_TABLE} AS
+        SELECT {select_list} FROM {parquet_scan(source_url)}
+    """)
+    return SOURCE_TABLE
+
+
+def _read_source(
+    conn: duckdb.DuckDBPyConnection,
+    source_url: str,
+    counts: str,
+    *,
+    stage: bool = False,
+    columns: tuple[str, ...] | None = None,
+) -> tuple[str, tuple]:
+    """Open the source (staging it locally if requested) and count it in one scan.
+
+    Args:
+        conn: DuckDB connection to use
+        source_url: Validated source URL or path
+        counts: SELECT list of the aggregates to compute over the source
+        stage: Copy the source into a temp table first (see _stage_source)
+        columns: Source columns to keep when staging (default: all)
+
+    Returns:
+        Tuple of (source relation for query templates, row of counts)
+
+    Raises:
+        SourceReadError: If source data cannot be read
+    """
+    logger.info("Reading from: %s", source_url)
+    try:
+        source = _stage_source(conn, source_url, columns) if stage else parquet_scan(source_url)
+        return source, conn.execute(f"SELECT {counts} FROM {source}").fetchone()
+    except Exception as e:
+        raise SourceReadError(
+            message=str(e),
+            source_url=source_url,
+        ) from e
+
+
+def _staging_path(output_path: Path) -> Path:
+    """Path an output is written to until it has been counted and validated.
+
+    Outputs are only renamed to their final path once complete, so an
+    interrupted run never leaves a partial file that --skip-existing would
+    treat as done.
+    """
+    return output_path.with_name(output_path.name + ".tmp")
+
+
+def _write_parquet(
+    conn: duckdb.DuckDBPyConnection,
+    query: str,
+    output_path: Path,
+    compression: Compression = Compression.ZSTD,
+) -> int:
+    """Write query results to output_path as parquet with the given compression.
+
+    Returns:
+        Number of rows written, as reported by COPY (no re-read of the output)
+    """
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return conn.execute(
+            f"""
+            COPY ({query})
+            TO $output_path (FORMAT PARQUET, {compression.value})
+            """,
+            {"output_path": str(output_path)},
+        ).fetchone()[0]
+    except Exception as e:
+        raise OutputWriteError(
+            message=str(e),
+            output_path=output_path,
+        ) from e
+
+
+def _log_bioguide_coverage(
+    conn: duckdb.DuckDBPyConnection, output_path: Path, output_count: int
+) -> None:
+    """Log how many output rows were linked to a bioguide_id.
+
+    Reads the null count from the parquet footer statistics rather than
+    scanning the bioguide_id column, unless a row group has no null count.
+    """
+    null_count, has_stats = conn.execute(
+        """
+        SELECT SUM(stats_null_count), COUNT(stats_null_count) = COUNT(*)
+        FROM parquet_metadata($output_path)
+        WHERE path_in_schema = 'bioguide_id'
+        """,
+        {"output_path": str(output_path)},
+    ).fetchone()
+    if has_stats:
+        matched_count = output_count - (null_count or 0)
+    else:
+        matched_count = conn.execute(
+            "SELECT COUNT(bioguide_id) FROM read_parquet($output_path)",
+            {"output_path": str(output_path)},
+        ).fetchone()[0]
+    coverage_pct = (matched_count / output_count * 100) if output_count > 0 else 0
+    logger.info(
+        "  Bioguide ID coverage: %s/%s (%.1f%%)",
+        f"{matched_count:,}",
+        f"{output_count:,}",
+        coverage_pct,
+    )
+
+
+# Bioguide lookup tables built so far, keyed by the lookup files they came from
+_bioguide_lookups: dict[tuple[str, int, str], str] = {}
+
+
+def _bioguide_lookup(conn: duckdb.DuckDBPyConnection, legislators_path: Path | str) -> str:
+    """Return a table of recipient → bioguide_id for the *_WITH_BIOGUIDE queries.
+
+    The table is built from the legislators and recipients files once per run
+    and kept in the shared database (visible to every cursor), so extracting
+    many cycles joins against it instead of re-reading both lookup files each
+    time. The file paths are bound as query parameters, so they need no escaping.
+
+    Returns:
+        Name of the lookup table, for use as a query template's {bioguide_lookup}
+
+    Raises:
+        SourceReadError: If the legislators or recipients file cannot be read
+    """
+    try:
+        # mtime in the key rebuilds the table if the legislators file is replaced
+        key = (str(legislators_path), Path(legislators_path).stat().st_mtime_ns, RECIPIENTS_URL)
+        with _database_lock:
+            table = _bioguide_lookups.get(key)
+            if table is None:
+                table = f"bioguide_lookup_{len(_bioguide_lookups)}"
+                logger.info("Building bioguide_id lookup...")
+                conn.execute(
+                    f"CREATE OR REPLACE TABLE {table} AS {BIOGUIDE_LOOKUP_QUERY}",
+                    {"legislators_path": str(legislators_path), "recipients_url": RECIPIENTS_URL},
+                )
+                _bioguide_lookups[key] = table
+    except (OSError, duckdb.Error) as e:
+        raise SourceReadError(
+            message=str(e),
+            source_url=str(legislators_path),
+        ) from e
+    return table
+
+
+def _organizational_query(
+    conn: duckdb.DuckDBPyConnection, source: str, legislators_path: Path | str | None
+) -> str:
+    """Build the organizational filter query, joining bioguide_id if requested."""
+    if legislators_path:
+        bioguide_lookup = _bioguide_lookup(conn, legislators_path)
+        logger.info("Filtering organizational contributions (with bioguide_id)...")
+        return ORGANIZATIONAL_QUERY_WITH_BIOGUIDE.format(
+            source=source, bioguide_lookup=bioguide_lookup
+        )
+    logger.info("Filtering organizational contributions...")
+    return ORGANIZATIONAL_QUERY.format(source=source)
+
+
+def _recipient_aggregates_query(
+    conn: duckdb.DuckDBPyConnection, source: str, legislators_path: Path | str | None
+) -> str:
+    """Build the recipient aggregation query, joining bioguide_id if requested."""
+    if legislators_path:
+        bioguide_lookup = _bioguide_lookup(conn, legislators_path)
+        logger.info("Aggregating by recipient (with bioguide_id)...")
+        return RECIPIENT_AGGREGATES_QUERY_WITH_BIOGUIDE.format(
+            source=source, bioguide_lookup=bioguide_lookup
+        )
+    logger.info("Aggregating by recipient...")
+    return RECIPIENT_AGGREGATES_QUERY.format(source=source)
+
+
+def download_source(
+    cycle: int,
+    cache_dir: Path | str,
+    *,
+    source_url: str | None = None,
+) -> Path:
+    """
+    Download a cycle's source parquet into cache_dir, unless already there.
+
+    Pass the returned path as source_url to the extract_* functions so every
+    query in every extraction reads the local copy instead of fetching the
+    file again. cache_dir must be within an allowed local directory for the
+    extractors to accept the returned path. Local sources are returned as-is.
+
+    Args:
+        cycle: Election cycle year (even year 1980-2024)
+        cache_dir: Directory to keep downloaded source files in
+        source_url: Optional custom source URL (default: HuggingFace)
+
+    Returns:
+        Path of the local source file
+
+    Raises:
+        InvalidCycleError: If cycle is not valid
+        InvalidSourceURLError: If source URL is not from an allowed domain
+        SourceReadError: If the source cannot be downloaded, including when the
+            server stops responding for DOWNLOAD_TIMEOUT_SECONDS
+    """
+    source_url = _resolve_source_url(cycle, source_url)
+    if not urlparse(source_url).scheme:
+        return Path(source_url)
+
+    local_path = Path(cache_dir) / Path(urlparse(source_url).path).name
+    if local_path.exists():
+        logger.info("Using cached source: %s", local_path)
+        return local_path
+
+    # Download next to the final path and rename, so an interrupted download is
+    # never mistaken for a cached file
+    staging_path = _staging_path(local_path)
+    logger.info("Downloading: %s", source_url)
+    try:
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            urllib.request.urlopen(source_url, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response,
+            staging_path.open("wb") as f,
+        ):
+            shutil.copyfileobj(response, f, length=1024 * 1024)
+        staging_path.replace(local_path)
+    except Exception as e:
+        raise SourceReadError(
+            message=str(e),
+            source_url=source_url,
+        ) from e
+    finally:
+        staging_path.unlink(missing_ok=True)
+    return local_path
+
+
 def extract_organizational_contributions(
     output_path: Path | str,
     cycle: int,
@@ -67,6 +388,8 @@ def extract_organizational_contributions(
     source_url: str | None = None,
     legislators_path: Path | str | None = None,
     validate: bool = True,
+    prefetch: bool = False,
+    compression: Compression = Compression.ZSTD,
 ) -> ExtractionResult:
     """
     Extract organizational contributions for a given cycle.
@@ -83,6 +406,8 @@ def extract_organizational_contributions(
         source_url: Optional custom source URL (default: HuggingFace)
         legislators_path: Optional path to legislators.parquet for bioguide_id join
         validate: Whether to run validation after extraction
+        prefetch: Stage the source in a local temp table before querying it
+        compression: Parquet compression for the output
 
     Returns:
         ExtractionResult with extraction details and validation results
@@ -95,101 +420,41 @@ def extract_organizational_contributions(
         OutputWriteError: If output cannot be written
     """
     output_path = Path(output_path)
+    staging_path = _staging_path(output_path)
 
-    # Validate cycle
-    if not validate_cycle(cycle):
-        raise InvalidCycleError(
-            message=f"Invalid cycle: {cycle}",
-            cycle=cycle,
-            min_cycle=MIN_CYCLE,
-            max_cycle=MAX_CYCLE,
-        )
-
-    source_url = source_url or CONTRIBUTIONS_URL_TEMPLATE.format(cycle=cycle)
-
-    # Validate source URL
-    if not validate_source_url(source_url):
-        raise InvalidSourceURLError(
-            message="Source URL must be from an allowed domain",
-            source_url=source_url,
-            allowed_domains=ALLOWED_SOURCE_DOMAINS,
-        )
+    source_url = _resolve_source_url(cycle, source_url)
 
     conn = None
     try:
-        conn = duckdb.connect()
+        conn = _connect()
 
         # Step 1: Count source rows
-        logger.info("Reading from: %s", source_url)
-        try:
-            source_rows = conn.execute(f"""
-                SELECT COUNT(*)
-                FROM read_parquet('{source_url}')
-            """).fetchone()[0]
-        except Exception as e:
-            raise SourceReadError(
-                message=str(e),
-                source_url=source_url,
-            ) from e
+        source, (source_rows,) = _read_source(conn, source_url, "COUNT(*)", stage=prefetch)
 
         logger.info("  Source rows: %s", f"{source_rows:,}")
 
         # Step 2: Execute filter query and write
-        if legislators_path:
-            logger.info("Filtering organizational contributions (with bioguide_id)...")
-            legislators_path_str = escape_sql_string(str(legislators_path))
-            query = ORGANIZATIONAL_QUERY_WITH_BIOGUIDE.format(
-                source_url=source_url,
-                legislators_path=legislators_path_str,
-                recipients_url=RECIPIENTS_URL,
-            )
-        else:
-            logger.info("Filtering organizational contributions...")
-            query = ORGANIZATIONAL_QUERY.format(source_url=source_url)
-
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            conn.execute(f"""
-                COPY ({query})
-                TO '{output_path}' (FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 3)
-            """)
-        except Exception as e:
-            raise OutputWriteError(
-                message=str(e),
-                output_path=output_path,
-            ) from e
-
-        # Step 3: Count output
-        output_count = conn.execute(f"""
-            SELECT COUNT(*) FROM read_parquet('{output_path}')
-        """).fetchone()[0]
+        query = _organizational_query(conn, source, legislators_path)
+        output_count = _write_parquet(conn, query, staging_path, compression)
         logger.info("  Organizational contributions: %s", f"{output_count:,}")
         filtered_count = source_rows - output_count
         logger.info("  Filtered out: %s individual contributions", f"{filtered_count:,}")
 
         # Log bioguide_id coverage if legislators_path was provided
         if legislators_path:
-            matched_count = conn.execute(f"""
-                SELECT COUNT(*) FROM read_parquet('{output_path}')
-                WHERE bioguide_id IS NOT NULL
-            """).fetchone()[0]
-            coverage_pct = (matched_count / output_count * 100) if output_count > 0 else 0
-            logger.info(
-                "  Bioguide ID coverage: %s/%s (%.1f%%)",
-                f"{matched_count:,}",
-                f"{output_count:,}",
-                coverage_pct,
-            )
+            _log_bioguide_coverage(conn, staging_path, output_count)
 
-        # Step 4: Validate
+        # Step 3: Validate
         validation = ValidationResult()
         if validate:
             logger.info("Validating...")
             validation = validate_organizational_output(
-                source_url, output_path, conn, source_rows, output_count
+                source_url, staging_path, conn, source_rows, output_count
             )
             logger.info("  Validation: PASS")
 
+        staging_path.replace(output_path)
+
         return ExtractionResult(
             source_url=source_url,
             output_path=output_path,
@@ -203,6 +468,7 @@ def extract_organizational_contributions(
     finally:
         if conn is not None:
             conn.close()
+        staging_path.unlink(missing_ok=True)
 
 
 def extract_recipient_aggregates(
@@ -212,6 +478,8 @@ def extract_recipient_aggregates(
     source_url: str | None = None,
     legislators_path: Path | str | None = None,
     validate: bool = True,
+    prefetch: bool = False,
+    compression: Compression = Compression.ZSTD,
     sample_size: int = 100,
 ) -> ExtractionResult:
     """
@@ -231,6 +499,8 @@ def extract_recipient_aggregates(
         source_url: Optional custom source URL (default: HuggingFace)
         legislators_path: Optional path to legislators.parquet for bioguide_id join
         validate: Whether to run validation after extraction
+        prefetch: Stage the source in a local temp table before querying it
+        compression: Parquet compression for the output
         sample_size: Sample size for aggregation validation
 
     Returns:
@@ -244,99 +514,53 @@ def extract_recipient_aggregates(
         OutputWriteError: If output cannot be written
     """
     output_path = Path(output_path)
+    staging_path = _staging_path(output_path)
 
-    # Validate cycle
-    if not validate_cycle(cycle):
-        raise InvalidCycleError(
-            message=f"Invalid cycle: {cycle}",
-            cycle=cycle,
-            min_cycle=MIN_CYCLE,
-            max_cycle=MAX_CYCLE,
-        )
-
-    source_url = source_url or CONTRIBUTIONS_URL_TEMPLATE.format(cycle=cycle)
-
-    # Validate source URL
-    if not validate_source_url(source_url):
-        raise InvalidSourceURLError(
-            message="Source URL must be from an allowed domain",
-            source_url=source_url,
-            allowed_domains=ALLOWED_SOURCE_DOMAINS,
-        )
+    source_url = _resolve_source_url(cycle, source_url)
 
     conn = None
     try:
-        conn = duckdb.connect()
-
-        # Step 1: Count source rows (with valid recipient ID)
-        logger.info("Reading from: %s", source_url)
-        try:
-            source_rows = conn.execute(f"""
-                SELECT COUNT(*)
-                FROM read_parquet('{source_url}')
-                WHERE "bonica.rid" IS NOT NULL
-            """).fetchone()[0]
-        except Exception as e:
-            raise SourceReadError(
-                message=str(e),
-                source_url=source_url,
-            ) from e
+        conn = _connect()
+
+        # Step 1: Count source rows (with valid recipient ID) and distinct recipients
+        # in the same scan, so validation does not have to re-read the source for them
+        source, (source_rows, source_distinct) = _read_source(
+            conn,
+            source_url,
+            'COUNT("bonica.rid"), COUNT(DISTINCT "bonica.rid")',
+            stage=prefetch,
+            columns=RECIPIENT_AGGREGATES_SOURCE_COLUMNS,
+        )
 
         logger.info("  Source rows (with recipient ID): %s", f"{source_rows:,}")
 
         # Step 2: Execute aggregation query and write
-        if legislators_path:
-            logger.info("Aggregating by recipient (with bioguide_id)...")
-            legislators_path_str = escape_sql_string(str(legislators_path))
-            query = RECIPIENT_AGGREGATES_QUERY_WITH_BIOGUIDE.format(
-                source_url=source_url,
-                legislators_path=legislators_path_str,
-                recipients_url=RECIPIENTS_URL,
-            )
-        else:
-            logger.info("Aggregating by recipient...")
-            query = RECIPIENT_AGGREGATES_QUERY.format(source_url=source_url)
-
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            conn.execute(f"""
-                COPY ({query})
-                TO '{output_path}' (FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 3)
-            """)
-        except Exception as e:
-            raise OutputWriteError(
-                message=str(e),
-                output_path=output_path,
-            ) from e
-
-        # Step 3: Count output
-        output_count = conn.execute(f"""
-            SELECT COUNT(*) FROM read_parquet('{output_path}')
-        """).fetchone()[0]
+        query = _recipient_aggregates_query(conn, source, legislators_path)
+        output_count = _write_parquet(conn, query, staging_path, compression)
         logger.info("  Distinct recipient groups: %s", f"{output_count:,}")
 
         # Log bioguide_id coverage if legislators_path was provided
         if legislators_path:
-            matched_count = conn.execute(f"""
-                SELECT COUNT(*) FROM read_parquet('{output_path}')
-                WHERE bioguide_id IS NOT NULL
-            """).fetchone()[0]
-            coverage_pct = (matched_count / output_count * 100) if output_count > 0 else 0
-            logger.info(
-                "  Bioguide ID coverage: %s/%s (%.1f%%)",
-                f"{matched_count:,}",
-                f"{output_count:,}",
-                coverage_pct,
-            )
+            _log_bioguide_coverage(conn, staging_path, output_count)
 
-        # Step 4: Validate
+        # Step 3: Validate
         validation = ValidationResult()
         if validate:
             logger.info("Validating...")
-            validation = validate_recipient_aggregates(source_url, output_path, conn, sample_size)
+            validation = validate_recipient_aggregates(
+                source_url,
+                staging_path,
+                conn,
+                sample_size,
+                source=source,
+                source_distinct=source_distinct,
+                output_count=output_count,
+            )
             verified = validation.aggregation_sample_size
             logger.info("  Validation: PASS (%d recipients verified)", verified)
 
+        staging_path.replace(output_path)
+
         return ExtractionResult(
             source_url=source_url,
             output_path=output_path,
@@ -350,6 +574,187 @@ def extract_recipient_aggregates(
     finally:
         if conn is not None:
             conn.close()
+        staging_path.unlink(missing_ok=True)
+
+
+def extract_organizational_and_aggregates(
+    organizational_path: Path | str,
+    aggregates_path: Path | str,
+    cycle: int,
+    *,
+    source_url: str | None = None,
+    legislators_path: Path | str | None = None,
+    raw_organizational_path: Path | str | None = None,
+    validate: bool = True,
+    sample_size: int = 100,
+    compression: Compression = Compression.ZSTD,
+) -> tuple[ExtractionResult, ...]:
+    """
+    Extract organizational contributions and recipient aggregates in one pass.
+
+    Produces the same outputs as extract_organizational_contributions followed
+    by extract_recipient_aggregates, but stages the source parquet into a
+    temporary table first so the source is read once instead of once per
+    output (and again for aggregate validation). DuckDB spills the staged
+    table to its temp directory if it outgrows the memory limit.
+
+    If raw_organizational_path is given, the output of
+    extract_raw_organizational_contributions is written from the same staged
+    source as well.
+
+    Args:
+        organizational_path: Path for organizational output .parquet file
+        aggregates_path: Path for recipient aggregates output .parquet file
+        cycle: Election cycle year (even year 1980-2024)
+        source_url: Optional custom source URL (default: HuggingFace)
+        legislators_path: Optional path to legislators.parquet for bioguide_id join
+        raw_organizational_path: Optional path for raw organizational output
+            .parquet file (requires legislators_path)
+        validate: Whether to run validation after extraction
+        sample_size: Sample size for aggregation validation
+        compression: Parquet compression for all outputs
+
+    Returns:
+        Tuple of (organizational, recipient aggregates) ExtractionResults,
+        followed by the raw organizational ExtractionResult if requested
+
+    Raises:
+        ValueError: If raw_organizational_path is given without legislators_path
+        InvalidCycleError: If cycle is not valid
+        InvalidSourceURLError: If source URL is not from an allowed domain
+        SourceReadError: If source data cannot be read
+        FilterValidationError: If organizational validation fails
+        AggregationIntegrityError: If aggregate validation fails
+        OutputWriteError: If output cannot be written
+    """
+    if raw_organizational_path is not None and not legislators_path:
+        raise ValueError("raw_organizational_path requires legislators_path")
+
+    organizational_path = Path(organizational_path)
+    aggregates_path = Path(aggregates_path)
+    org_staging_path = _staging_path(organizational_path)
+    agg_staging_path = _staging_path(aggregates_path)
+    raw_staging_path = None
+    if raw_organizational_path is not None:
+        raw_organizational_path = Path(raw_organizational_path)
+        raw_staging_path = _staging_path(raw_organizational_path)
+    source_url = _resolve_source_url(cycle, source_url)
+
+    conn = None
+    try:
+        conn = _connect()
+
+        # Step 1: Stage source once and count rows for both outputs
+        _, (source_rows, rid_rows, rid_distinct) = _read_source(
+            conn,
+            source_url,
+            'COUNT(*), COUNT("bonica.rid"), COUNT(DISTINCT "bonica.rid")',
+            stage=True,
+        )
+
+        logger.info("  Source rows: %s", f"{source_rows:,}")
+
+        # Step 2: Organizational contributions
+        query = _organizational_query(conn, SOURCE_TABLE, legislators_path)
+        org_count = _write_parquet(conn, query, org_staging_path, compression)
+        logger.info("  Organizational contributions: %s", f"{org_count:,}")
+        logger.info("  Filtered out: %s individual contributions", f"{source_rows - org_count:,}")
+        if legislators_path:
+            _log_bioguide_coverage(conn, org_staging_path, org_count)
+
+        org_validation = ValidationResult()
+        if validate:
+            logger.info("Validating...")
+            org_validation = validate_organizational_output(
+                source_url, org_staging_path, conn, source_rows, org_count
+            )
+            logger.info("  Validation: PASS")
+        org_staging_path.replace(organizational_path)
+
+        # Step 3: Recipient aggregates
+        query = _recipient_aggregates_query(conn, SOURCE_TABLE, legislators_path)
+        agg_count = _write_parquet(conn, query, agg_staging_path, compression)
+        logger.info("  Distinct recipient groups: %s", f"{agg_count:,}")
+        if legislators_path:
+            _log_bioguide_coverage(conn, agg_staging_path, agg_count)
+
+        agg_validation = ValidationResult()
+        if validate:
+            logger.info("Validating...")
+            agg_validation = validate_recipient_aggregates(
+                source_url,
+                agg_staging_path,
+                conn,
+                sample_size,
+                source=SOURCE_TABLE,
+                source_distinct=rid_distinct,
+                output_count=agg_count,
+            )
+            verified = agg_validation.aggregation_sample_size
+            logger.info("  Validation: PASS (%d recipients verified)", verified)
+        agg_staging_path.replace(aggregates_path)
+
+        results = (
+            ExtractionResult(
+                source_url=source_url,
+                output_path=organizational_path,
+                cycle=cycle,
+                output_type=OutputType.ORGANIZATIONAL,
+                source_rows=source_rows,
+                output_count=org_count,
+                validation=org_validation,
+            ),
+            ExtractionResult(
+                source_url=source_url,
+                output_path=aggregates_path,
+                cycle=cycle,
+                output_type=OutputType.RECIPIENT_AGGREGATES,
+                source_rows=rid_rows,
+                output_count=agg_count,
+                validation=agg_validation,
+            ),
+        )
+        if raw_staging_path is None:
+            return results
+
+        # Step 4: Raw organizational contributions
+        logger.info("Extracting raw organizational contributions (with bioguide_id)...")
+        query = RAW_ORGANIZATIONAL_CONTRIBUTIONS_QUERY.format(
+            source=SOURCE_TABLE, bioguide_lookup=_bioguide_lookup(conn, legislators_path)
+        )
+        raw_count = _write_parquet(conn, query, raw_staging_path, compression)
+        logger.info("  Raw organizational contributions: %s", f"{raw_count:,}")
+        _log_bioguide_coverage(conn, raw_staging_path, raw_count)
+
+        raw_validation = ValidationResult()
+        if validate:
+            logger.info("Validating...")
+            raw_validation = validate_organizational_output(
+                source_url, raw_staging_path, conn, source_rows, raw_count
+            )
+            logger.info("  Validation: PASS")
+        raw_staging_path.replace(raw_organizational_path)
+
+        return (
+            *results,
+            ExtractionResult(
+                source_url=source_url,
+                output_path=raw_organizational_path,
+                cycle=cycle,
+                output_type=OutputType.RAW_ORGANIZATIONAL,
+                source_rows=source_rows,
+                output_count=raw_count,
+                validation=raw_validation,
+            ),
+        )
+
+    finally:
+        if conn is not None:
+            conn.close()
+        org_staging_path.unlink(missing_ok=True)
+        agg_staging_path.unlink(missing_ok=True)
+        if raw_staging_path is not None:
+            raw_staging_path.unlink(missing_ok=True)
 
 
 def extract_raw_organizational_contributions(
@@ -359,6 +764,8 @@ def extract_raw_organizational_contributions(
     *,
     source_url: str | None = None,
     validate: bool = True,
+    prefetch: bool = False,
+    compression: Compression = Compression.ZSTD,
 ) -> ExtractionResult:
     """
     Extract raw organizational contributions with bioguide_id for a given cycle.
@@ -375,6 +782,8 @@ def extract_raw_organizational_contributions(
         legislators_path: Path to legislators.parquet for bioguide_id join (required)
         source_url: Optional custom source URL (default: HuggingFace)
         validate: Whether to run validation after extraction
+        prefetch: Stage the source in a local temp table before querying it
+        compression: Parquet compression for the output
 
     Returns:
         ExtractionResult with extraction details and validation results
@@ -387,97 +796,50 @@ def extract_raw_organizational_contributions(
         OutputWriteError: If output cannot be written
     """
     output_path = Path(output_path)
+    staging_path = _staging_path(output_path)
     legislators_path = Path(legislators_path)
 
-    # Validate cycle
-    if not validate_cycle(cycle):
-        raise InvalidCycleError(
-            message=f"Invalid cycle: {cycle}",
-            cycle=cycle,
-            min_cycle=MIN_CYCLE,
-            max_cycle=MAX_CYCLE,
-        )
-
-    source_url = source_url or CONTRIBUTIONS_URL_TEMPLATE.format(cycle=cycle)
-
-    # Validate source URL
-    if not validate_source_url(source_url):
-        raise InvalidSourceURLError(
-            message="Source URL must be from an allowed domain",
-            source_url=source_url,
-            allowed_domains=ALLOWED_SOURCE_DOMAINS,
-        )
+    source_url = _resolve_source_url(cycle, source_url)
 
     conn = None
     try:
-        conn = duckdb.connect()
+        conn = _connect()
 
         # Step 1: Count source rows
-        logger.info("Reading from: %s", source_url)
-        try:
-            source_rows = conn.execute(f"""
-                SELECT COUNT(*)
-                FROM read_parquet('{source_url}')
-            """).fetchone()[0]
-        except Exception as e:
-            raise SourceReadError(
-                message=str(e),
-                source_url=source_url,
-            ) from e
+        source, (source_rows,) = _read_source(
+            conn,
+            source_url,
+            "COUNT(*)",
+            stage=prefetch,
+            columns=RAW_ORGANIZATIONAL_SOURCE_COLUMNS,
+        )
 
         logger.info("  Source rows: %s", f"{source_rows:,}")
 
         # Step 2: Execute filter query with bioguide join and write
         logger.info("Extracting raw organizational contributions (with bioguide_id)...")
-        legislators_path_str = escape_sql_string(str(legislators_path))
         query = RAW_ORGANIZATIONAL_CONTRIBUTIONS_QUERY.format(
-            source_url=source_url,
-            legislators_path=legislators_path_str,
-            recipients_url=RECIPIENTS_URL,
+            source=source, bioguide_lookup=_bioguide_lookup(conn, legislators_path)
         )
-
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            conn.execute(f"""
-                COPY ({query})
-                TO '{output_path}' (FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 3)
-            """)
-        except Exception as e:
-            raise OutputWriteError(
-                message=str(e),
-                output_path=output_path,
-            ) from e
-
-        # Step 3: Count output and coverage
-        output_count = conn.execute(f"""
-            SELECT COUNT(*) FROM read_parquet('{output_path}')
-        """).fetchone()[0]
+        output_count = _write_parquet(conn, query, staging_path, compression)
         logger.info("  Raw organizational contributions: %s", f"{output_count:,}")
         filtered_count = source_rows - output_count
         logger.info("  Filtered out: %s individual contributions", f"{filtered_count:,}")
 
         # Log bioguide_id coverage
-        matched_count = conn.execute(f"""
-            SELECT COUNT(*) FROM read_parquet('{output_path}')
-            WHERE bioguide_id IS NOT NULL
-        """).fetchone()[0]
-        coverage_pct = (matched_count / output_count * 100) if output_count > 0 else 0
-        logger.info(
-            "  Bioguide ID coverage: %s/%s (%.1f%%)",
-            f"{matched_count:,}",
-            f"{output_count:,}",
-            coverage_pct,
-        )
+        _log_bioguide_coverage(conn, staging_path, output_count)
 
-        # Step 4: Validate
+        # Step 3: Validate
         validation = ValidationResult()
         if validate:
             logger.info("Validating...")
             validation = validate_organizational_output(
-                source_url, output_path, conn, source_rows, output_count
+                source_url, staging_path, conn, source_rows, output_count
             )
             logger.info("  Validation: PASS")
 
+        staging_path.replace(output_path)
+
         return ExtractionResult(
             source_url=source_url,
             output_path=output_path,
@@ -491,3 +853,61 @@ def extract_raw_organizational_contributions(
     finally:
         if conn is not None:
             conn.close()
+        staging_path.unlink(missing_ok=True)
+
+
+def export_to_duckdb(
+    parquet_path: Path | str,
+    database_path: Path | str,
+    table_name: str = "recipient_aggregates",
+) -> Path:
+    """
+    Copy a parquet output into a table of a native DuckDB database file.
+
+    DuckDB reads its own storage format faster than parquet, so DuckDB-based
+    consumers that query an output repeatedly can attach the database instead.
+    Row order is preserved. The database is written to a .tmp path and renamed,
+    replacing any previous export.
+
+    Args:
+        parquet_path: Validated parquet output to copy
+        database_path: Path for the .duckdb database file
+        table_name: Name of the table to create
+
+    Returns:
+        Path of the database file
+
+    Raises:
+        OutputWriteError: If the database cannot be written
+    """
+    database_path = Path(database_path)
+    staging_path = _staging_path(database_path)
+
+    conn = None
+    try:
+        staging_path.unlink(missing_ok=True)
+        # A connection of its own on the staging file, rather than an ATTACH on
+        # the shared database, whose aliases would collide across concurrent
+        # exports and outlive a failed one
+        conn = duckdb.connect(str(staging_path))
+        conn.execute(
+            f"""
+            CREATE TABLE "{table_name}" AS
+            SELECT * FROM read_parquet($parquet_path)
+            """,
+            {"parquet_path": str(parquet_path)},
+        )
+        conn.close()
+        conn = None
+        staging_path.replace(database_path)
+        logger.info("  Created: %s", database_path)
+        return database_path
+    except Exception as e:
+        raise OutputWriteError(
+            message=str(e),
+            output_path=database_path,
+        ) from e
+    finally:
+        if conn is not None:
+            conn.close()
+        staging_path.unlink(missing_ok=True)
@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
-import pyarrow as pa
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 # =============================================================================
 # SOURCE CONFIGURATION
 # =============================================================================
 
 HF_BASE_URL = "https://huggingface.co/datasets/Dustinhax/tyt/resolve/main"
+# Each extraction reads a cycle's file several times (count, query, validation).
+# extractor._connect() enables DuckDB's parquet_metadata_cache and HTTP metadata
+# cache on the shared database, so each file's footer is fetched and parsed once
+# per run.
 CONTRIBUTIONS_URL_TEMPLATE = f"{HF_BASE_URL}/dime/contributions/by_year/contribDB_{{cycle}}.parquet"
 RECIPIENTS_URL = f"{HF_BASE_URL}/dime/recipients/dime_recipients_all_1979_2024.parquet"
+# Seconds download_source() waits on a connect or read before giving up, so a
+# stalled connection fails instead of hanging the run (not a whole-file limit)
+DOWNLOAD_TIMEOUT_SECONDS = 60
 
 # Allowed domains for source URLs (SQL injection mitigation)
-ALLOWED_SOURCE_DOMAINS = [
-    "huggingface.co",
-]
+# A tuple so validate_source_url can pass it straight to str.endswith
+ALLOWED_SOURCE_DOMAINS = ("huggingface.co",)
+
+# https:// URLs on an allowed domain, for validate_source_url's fast path
+_ALLOWED_URL_PREFIXES = tuple(f"https://{domain}/" for domain in ALLOWED_SOURCE_DOMAINS)
 
 # Allowed local directories for source files (path traversal mitigation)
 # Security model: Only allow files from known-safe directories to prevent
@@ -29,31 +43,28 @@ _env_dirs = (
     if os.environ.get("DIME_ALLOWED_DIRS")
     else []
 )
-ALLOWED_LOCAL_DIRECTORIES = [
+ALLOWED_LOCAL_DIRECTORIES = (
     "/tmp/",
     *[d for d in _env_dirs if d],  # Filter empty strings
-]
-
-
-def escape_sql_string(value: str) -> str:
-    """Escape a string value for safe SQL interpolation.
-
-    Escapes single quotes and backslashes to prevent SQL injection.
+)
 
-    Args:
-        value: String value to escape
 
-    Returns:
-        Escaped string safe for SQL interpolation
-    """
-    # Escape backslashes first, then single quotes
-    return value.replace("\\", "\\\\").replace("'", "''")
+# Obvious SQL injection patterns, combined into one case-insensitive regex:
+# a statement after a semicolon (comment, DROP, DELETE, INSERT, UPDATE),
+# UNION injection, or OR injection. The statements share the `;\s*` prefix so
+# it is matched once per position rather than once per keyword.
+_DANGEROUS_PATH_RE = re.compile(
+    r";\s*(?:--|DROP|DELETE|INSERT|UPDATE)|UNION\s+SELECT|'\s*OR\s+'",
+    re.IGNORECASE,
+)
 
 
+@functools.lru_cache(maxsize=256)
 def validate_path_string(path: str) -> bool:
     """Validate a file path string for safe SQL use.
 
-    Rejects paths containing SQL injection patterns.
+    Rejects paths containing SQL injection patterns. Results are cached: the
+    check is pure and a run validates the same few URLs once per cycle.
 
     Args:
         path: File path to validate
@@ -61,18 +72,11 @@ def validate_path_string(path: str) -> bool:
     Returns:
         True if path is safe for SQL interpolation
     """
-    # Reject obvious SQL injection patterns
-    dangerous_patterns = [
-        r";\s*--",  # SQL comment after semicolon
-        r";\s*DROP",  # DROP statement
-        r";\s*DELETE",  # DELETE statement
-        r";\s*INSERT",  # INSERT statement
-        r";\s*UPDATE",  # UPDATE statement
-        r"UNION\s+SELECT",  # UNION injection
-        r"'\s*OR\s+'",  # OR injection
-    ]
-    path_upper = path.upper()
-    return all(not re.search(pattern, path_upper, re.IGNORECASE) for pattern in dangerous_patterns)
+    # Every pattern needs a ';', a quote, or UNION. Most paths contain none of
+    # them, so a few C-level substring scans clear them before the regex runs.
+    if ";" not in path and "'" not in path and "union" not in path.lower():
+        return True
+    return _DANGEROUS_PATH_RE.search(path) is None
 
 
 def validate_source_url(url: str) -> bool:
@@ -84,23 +88,25 @@ def validate_source_url(url: str) -> bool:
     Returns:
         True if URL is from an allowed domain or is a valid local file path
     """
-    from pathlib import Path
-    from urllib.parse import urlparse
-
     # Validate path string for SQL safety
     if not validate_path_string(url):
         return False
 
+    # Fast path for the default source (the common case): a plain prefix test
+    # instead of parsing the URL. The SQL-safety check above still applies.
+    if url.startswith(_ALLOWED_URL_PREFIXES):
+        return True
+
     # Allow local file paths within allowed directories
-    if url.startswith("/") or url.startswith("./"):
+    if url.startswith(("/", "./")):
         path = Path(url).resolve()
         if not path.exists():
             return False
         # Check if path is within an allowed directory
-        return any(str(path).startswith(allowed_dir) for allowed_dir in ALLOWED_LOCAL_DIRECTORIES)
+        return str(path).startswith(ALLOWED_LOCAL_DIRECTORIES)
 
     parsed = urlparse(url)
-    return any(parsed.netloc.endswith(domain) for domain in ALLOWED_SOURCE_DOMAINS)
+    return parsed.netloc.endswith(ALLOWED_SOURCE_DOMAINS)
 
 
 # =============================================================================
@@ -110,12 +116,13 @@ def validate_source_url(url: str) -> bool:
 # Election cycles (1980-2024, even years)
 MIN_CYCLE = 1980
 MAX_CYCLE = 2024
-ALL_CYCLES = list(range(MIN_CYCLE, MAX_CYCLE + 1, 2))  # 23 cycles
+ALL_CYCLES = range(MIN_CYCLE, MAX_CYCLE + 1, 2)  # 23 cycles; O(1) membership
 
 
 def validate_cycle(cycle: int) -> bool:
     """Check if cycle is valid (even year between MIN_CYCLE and MAX_CYCLE)."""
-    return cycle in ALL_CYCLES
+    # Arithmetic equivalent of `cycle in ALL_CYCLES`
+    return MIN_CYCLE <= cycle <= MAX_CYCLE and cycle % 2 == 0
 
 
 # =============================================================================
@@ -124,66 +131,127 @@ def validate_cycle(cycle: int) -> bool:
 # Year suffix length to strip from DIME ICPSR (e.g., "S4VT000332020" → "S4VT00033")
 YEAR_SUFFIX_LENGTH = 4
 
-# FEC lookup CTE - flattens fec_ids array for joining to DIME contributions
-# Uses UNNEST to expand array of FEC IDs into separate rows for matching
-FEC_LOOKUP_CTE = """
+
+# =============================================================================
+# SQL QUERIES
+# =============================================================================
+
+# Query templates read contributions from a `{source}` relation: either a direct
+# scan built by parquet_scan() or the name of a temp table the source was staged
+# into (SOURCE_TABLE) so that several outputs can share one read.
+SOURCE_TABLE = "source_contributions"
+
+
+def parquet_scan(source_url: str) -> str:
+    """Build the read_parquet() relation for a validated source URL or path.
+
+    Sources are single files, so hive partition detection is switched off.
+    The relation is spliced into query templates rather than bound, so quotes
+    in the URL are doubled to keep it a single SQL string literal.
+    """
+    quoted_url = source_url.replace("'", "''")
+    return f"read_parquet('{quoted_url}', hive_partitioning = false)"
+
+
+# Source columns each query reads, so a staged source only has to hold (and
+# fetch) those columns. The organizational queries keep every source column.
+RECIPIENT_AGGREGATES_SOURCE_COLUMNS = (
+    "bonica.rid",
+    "recipient.name",
+    "recipient.party",
+    "recipient.type",
+    "recipient.state",
+    "candidate.cfscore",
+    "contributor.type",
+    "amount",
+)
+
+RAW_ORGANIZATIONAL_SOURCE_COLUMNS = (
+    "cycle",
+    "bonica.rid",
+    "recipient.name",
+    "contributor.name",
+    "contributor.type",
+    "bonica.cid",
+    "amount",
+    "date",
+    "contributor.state",
+)
+
+
+# Recipient → bioguide_id lookup shared by the *_WITH_BIOGUIDE queries
+# JOIN path: recipients (ICPSR) → legislators (on FEC ID)
+# Matches FEC-style ICPSR only (H/S prefix, year suffix stripped): DIME stores
+# "{fec_id}{year}" (e.g., "S4VT000332020" = FEC ID + 2020). Built once
+# per legislators file and referenced by the queries as `{bioguide_lookup}`.
+# Holds matched recipients only: the queries LEFT JOIN to it, so unmatched
+# recipients still get a NULL bioguide_id, and the join's hash table stays
+# small (~10% of recipients). Recipients with matched and unmatched ICPSR rows
+# map to their bioguide_id only, not also to a duplicate NULL row. With one
+# row per recipient, the joins keep one output row per contribution and need
+# no DISTINCT over the (wide) joined rows.
+BIOGUIDE_LOOKUP_QUERY = f"""
 WITH fec_lookup AS (
     SELECT bioguide_id, UNNEST(fec_ids) as fec_id
-    FROM read_parquet('{legislators_path}')
+    FROM read_parquet($legislators_path)
     WHERE fec_ids IS NOT NULL AND LEN(fec_ids) > 0
+),
+fec_recipients AS (
+    -- Strip the year suffix once per recipient so the join key is a plain column
+    SELECT
+        "bonica.rid",
+        SUBSTRING("ICPSR", 1, LENGTH("ICPSR") - {YEAR_SUFFIX_LENGTH}) AS icpsr_prefix
+    FROM read_parquet($recipients_url)
+    WHERE "ICPSR" IS NOT NULL AND LENGTH("ICPSR") > {YEAR_SUFFIX_LENGTH}
+      AND "ICPSR"[1] IN ('H', 'S')
+),
+recipients_with_bioguide AS (
+    -- One bioguide_id per recipient (the first, if its FEC IDs match several)
+    SELECT
+        r."bonica.rid",
+        f.bioguide_id
+    FROM fec_recipients r
+    JOIN fec_lookup f ON r.icpsr_prefix = f.fec_id
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY r."bonica.rid" ORDER BY f.bioguide_id) = 1
 )
+SELECT "bonica.rid", bioguide_id
+FROM recipients_with_bioguide
 """
 
-# FEC join condition pattern
-# Matches FEC-style ICPSR only (H/S prefix for House/Senate, strips year suffix)
-# DIME stores "{fec_id}{year}" format (e.g., "S4VT000332020" = FEC ID + 2020)
-# This join only matches ~10% of DIME records (those with FEC-style ICPSR)
-FEC_JOIN_CONDITION = """SUBSTRING(CAST({alias}."ICPSR" AS VARCHAR), 1,
-              LENGTH(CAST({alias}."ICPSR" AS VARCHAR)) - 4) = fec_lookup.fec_id
-    AND (CAST({alias}."ICPSR" AS VARCHAR) LIKE 'H%'
-         OR CAST({alias}."ICPSR" AS VARCHAR) LIKE 'S%')"""
-
-
-# =============================================================================
-# SQL QUERIES
-# =============================================================================
 
 # Organizational contributions filter
 # Filters out individual contributors (contributor.type = 'I')
 # Keeps PACs, corporations, committees, unions, and other organizations
+# Sorted by contributor.type so each row group spans few type codes and readers
+# filtering on it can skip row groups using min/max statistics
 ORGANIZATIONAL_QUERY = """
 SELECT *
-FROM read_parquet('{source_url}')
+FROM {source}
 WHERE "contributor.type" != 'I'
   AND "contributor.type" IS NOT NULL
+ORDER BY "contributor.type"
 """
 
 # Organizational contributions filter WITH bioguide_id (requires legislators lookup)
-# JOIN path: contributions → recipients (on bonica.rid) → legislators (on FEC ID)
+# JOIN path: contributions → bioguide lookup (on bonica.rid)
 # LEFT JOINs keep all organizational records even when bioguide_id is NULL
+# No DISTINCT: identical source rows are separate contributions and are all kept
+# The contributor.type filter sits on the scan itself, so it is applied (and
+# row groups pruned) before the join rather than relying on the optimizer
+# Selects c.* on purpose: this output is the full source record. The narrow,
+# projected variant is RAW_ORGANIZATIONAL_CONTRIBUTIONS_QUERY.
 ORGANIZATIONAL_QUERY_WITH_BIOGUIDE = """
-WITH fec_lookup AS (
-    SELECT bioguide_id, UNNEST(fec_ids) as fec_id
-    FROM read_parquet('{legislators_path}')
-    WHERE fec_ids IS NOT NULL AND LEN(fec_ids) > 0
-),
-recipients_with_bioguide AS (
-    SELECT DISTINCT
-        r."bonica.rid",
-        f.bioguide_id
-    FROM read_parquet('{recipients_url}') r
-    LEFT JOIN fec_lookup f ON
-        SUBSTRING(r."ICPSR", 1, LENGTH(r."ICPSR") - 4) = f.fec_id
-        AND (r."ICPSR" LIKE 'H%' OR r."ICPSR" LIKE 'S%')
-    WHERE r."ICPSR" IS NOT NULL AND LENGTH(r."ICPSR") > 4
-)
-SELECT DISTINCT
+SELECT
     rb.bioguide_id,
     c.*
-FROM read_parquet('{source_url}') c
-LEFT JOIN recipients_with_bioguide rb ON c."bonica.rid" = rb."bonica.rid"
-WHERE c."contributor.type" != 'I'
-  AND c."contributor.type" IS NOT NULL
+FROM (
+    SELECT *
+    FROM {source}
+    WHERE "contributor.type" != 'I'
+      AND "contributor.type" IS NOT NULL
+) c
+LEFT JOIN {bioguide_lookup} rb ON c."bonica.rid" = rb."bonica.rid"
+ORDER BY c."contributor.type"
 """
 
 # Recipient aggregates
@@ -201,14 +269,13 @@ SELECT
     AVG(amount) as avg_amount,
     COUNT(*) as contribution_count,
     -- Individual contributor breakdown (contributor.type = 'I')
-    SUM(CASE WHEN "contributor.type" = 'I' THEN amount ELSE 0 END) as individual_total,
-    SUM(CASE WHEN "contributor.type" = 'I' THEN 1 ELSE 0 END) as individual_count,
+    -- FILTER aggregates only the matching rows; COALESCE keeps empty sums at 0
+    COALESCE(SUM(amount) FILTER (WHERE "contributor.type" = 'I'), 0) as individual_total,
+    COUNT(*) FILTER (WHERE "contributor.type" = 'I') as individual_count,
     -- Organizational contributor breakdown (PACs, corporations, committees, etc.)
-    SUM(CASE WHEN "contributor.type" != 'I' AND "contributor.type" IS NOT NULL
-        THEN amount ELSE 0 END) as organizational_total,
-    SUM(CASE WHEN "contributor.type" != 'I' AND "contributor.type" IS NOT NULL
-        THEN 1 ELSE 0 END) as organizational_count
-FROM read_parquet('{source_url}')
+    COALESCE(SUM(amount) FILTER (WHERE "contributor.type" != 'I'), 0) as organizational_total,
+    COUNT(*) FILTER (WHERE "contributor.type" != 'I') as organizational_count
+FROM {source}
 -- Defensive: all DIME records have bonica.rid, but guard against future edge cases
 WHERE "bonica.rid" IS NOT NULL
 GROUP BY
@@ -222,25 +289,10 @@ ORDER BY total_amount DESC
 """
 
 # Recipient aggregates WITH bioguide_id (requires legislators lookup)
-# JOIN path: contributions → recipients (on bonica.rid) → legislators (on FEC ID)
+# JOIN path: aggregates → bioguide lookup (on bonica.rid)
 # bioguide_id will be NULL for ~90% of records (non-FEC ICPSR formats)
 RECIPIENT_AGGREGATES_QUERY_WITH_BIOGUIDE = """
-WITH fec_lookup AS (
-    SELECT bioguide_id, UNNEST(fec_ids) as fec_id
-    FROM read_parquet('{legislators_path}')
-    WHERE fec_ids IS NOT NULL AND LEN(fec_ids) > 0
-),
-recipients_with_bioguide AS (
-    SELECT DISTINCT
-        r."bonica.rid",
-        f.bioguide_id
-    FROM read_parquet('{recipients_url}') r
-    LEFT JOIN fec_lookup f ON
-        SUBSTRING(r."ICPSR", 1, LENGTH(r."ICPSR") - 4) = f.fec_id
-        AND (r."ICPSR" LIKE 'H%' OR r."ICPSR" LIKE 'S%')
-    WHERE r."ICPSR" IS NOT NULL AND LENGTH(r."ICPSR") > 4
-),
-aggregates AS (
+WITH aggregates AS (
     SELECT
         "bonica.rid",
         "recipient.name",
@@ -251,13 +303,12 @@ aggregates AS (
         SUM(amount) as total_amount,
         AVG(amount) as avg_amount,
         COUNT(*) as contribution_count,
-        SUM(CASE WHEN "contributor.type" = 'I' THEN amount ELSE 0 END) as individual_total,
-        SUM(CASE WHEN "contributor.type" = 'I' THEN 1 ELSE 0 END) as individual_count,
-        SUM(CASE WHEN "contributor.type" != 'I' AND "contributor.type" IS NOT NULL
-            THEN amount ELSE 0 END) as organizational_total,
-        SUM(CASE WHEN "contributor.type" != 'I' AND "contributor.type" IS NOT NULL
-            THEN 1 ELSE 0 END) as organizational_count
-    FROM read_parquet('{source_url}')
+        COALESCE(SUM(amount) FILTER (WHERE "contributor.type" = 'I'), 0) as individual_total,
+        COUNT(*) FILTER (WHERE "contributor.type" = 'I') as individual_count,
+        COALESCE(SUM(amount) FILTER (WHERE "contributor.type" != 'I'), 0)
+            as organizational_total,
+        COUNT(*) FILTER (WHERE "contributor.type" != 'I') as organizational_count
+    FROM {source}
     WHERE "bonica.rid" IS NOT NULL
     GROUP BY
         "bonica.rid",
@@ -267,7 +318,10 @@ aggregates AS (
         "recipient.state",
         "candidate.cfscore"
 )
-SELECT DISTINCT
+-- Aggregated before the join, so the join sees one row per recipient group.
+-- Groups are unique and the bioguide lookup has one row per recipient, so
+-- the join cannot produce duplicate rows and needs no DISTINCT of its own.
+SELECT
     rb.bioguide_id,
     agg."bonica.rid",
     agg."recipient.name",
@@ -283,31 +337,17 @@ SELECT DISTINCT
     agg.organizational_total,
     agg.organizational_count
 FROM aggregates agg
-LEFT JOIN recipients_with_bioguide rb ON agg."bonica.rid" = rb."bonica.rid"
+LEFT JOIN {bioguide_lookup} rb ON agg."bonica.rid" = rb."bonica.rid"
 ORDER BY agg.total_amount DESC
 """
 
 # Raw organizational contributions (NEW: detailed records with bioguide_id)
-# JOIN path: contributions → recipients (on bonica.rid) → legislators (on FEC ID)
+# JOIN path: contributions → bioguide lookup (on bonica.rid)
 # contributor.type != 'I' filters to organizational contributors only
 # LEFT JOIN keeps records even when bioguide_id cannot be determined
+# No DISTINCT: identical source rows are separate contributions and are all kept
 RAW_ORGANIZATIONAL_CONTRIBUTIONS_QUERY = """
-WITH fec_lookup AS (
-    SELECT bioguide_id, UNNEST(fec_ids) as fec_id
-    FROM read_parquet('{legislators_path}')
-    WHERE fec_ids IS NOT NULL AND LEN(fec_ids) > 0
-),
-recipients_with_bioguide AS (
-    SELECT DISTINCT
-        r."bonica.rid",
-        f.bioguide_id
-    FROM read_parquet('{recipients_url}') r
-    LEFT JOIN fec_lookup f ON
-        SUBSTRING(r."ICPSR", 1, LENGTH(r."ICPSR") - 4) = f.fec_id
-        AND (r."ICPSR" LIKE 'H%' OR r."ICPSR" LIKE 'S%')
-    WHERE r."ICPSR" IS NOT NULL AND LENGTH(r."ICPSR") > 4
-)
-SELECT DISTINCT
+SELECT
     rb.bioguide_id,
     c.cycle,
     c."bonica.rid",
@@ -318,35 +358,51 @@ SELECT DISTINCT
     c.amount,
     c.date,
     c."contributor.state" as contributor_state
-FROM read_parquet('{source_url}') c
-LEFT JOIN recipients_with_bioguide rb ON c."bonica.rid" = rb."bonica.rid"
-WHERE c."contributor.type" != 'I'
-  AND c."contributor.type" IS NOT NULL
+FROM (
+    SELECT *
+    FROM {source}
+    WHERE "contributor.type" != 'I'
+      AND "contributor.type" IS NOT NULL
+) c
+LEFT JOIN {bioguide_lookup} rb ON c."bonica.rid" = rb."bonica.rid"
+ORDER BY c."contributor.type"
 """
 
 # =============================================================================
 # OUTPUT SCHEMAS
 # =============================================================================
 
-RECIPIENT_AGGREGATES_SCHEMA = pa.schema(
-    [
-        pa.field("bonica.rid", pa.string(), nullable=False),
-        pa.field("recipient.name", pa.string()),
-        pa.field("recipient.party", pa.string()),
-        pa.field("recipient.type", pa.string()),
-        pa.field("recipient.state", pa.string()),
-        pa.field("candidate.cfscore", pa.float64()),
-        pa.field("total_amount", pa.float64()),
-        pa.field("avg_amount", pa.float64()),
-        pa.field("contribution_count", pa.int64()),
-        pa.field("individual_total", pa.float64()),
-        pa.field("individual_count", pa.int64()),
-        pa.field("organizational_total", pa.float64()),
-        pa.field("organizational_count", pa.int64()),
-    ]
-)
-
-RECIPIENT_AGGREGATES_COLUMNS = [
+# Built on first use: importing pyarrow is the bulk of this module's import
+# time, and only code that checks outputs against a schema needs it.
+# The *_COLUMNS tuples repeat each schema's field names so they are available
+# without pyarrow; tests keep the two in step.
+
+
+@functools.cache
+def recipient_aggregates_schema() -> pa.Schema:
+    """Arrow schema of the recipient aggregates output."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field("bonica.rid", pa.string(), nullable=False),
+            pa.field("recipient.name", pa.string()),
+            pa.field("recipient.party", pa.string()),
+            pa.field("recipient.type", pa.string()),
+            pa.field("recipient.state", pa.string()),
+            pa.field("candidate.cfscore", pa.float64()),
+            pa.field("total_amount", pa.float64()),
+            pa.field("avg_amount", pa.float64()),
+            pa.field("contribution_count", pa.int64()),
+            pa.field("individual_total", pa.float64()),
+            pa.field("individual_count", pa.int64()),
+            pa.field("organizational_total", pa.float64()),
+            pa.field("organizational_count", pa.int64()),
+        ]
+    )
+
+
+RECIPIENT_AGGREGATES_COLUMNS = (
     "bonica.rid",
     "recipient.name",
     "recipient.party",
@@ -360,29 +416,36 @@ RECIPIENT_AGGREGATES_COLUMNS = [
     "individual_count",
     "organizational_total",
     "organizational_count",
-]
-
-# Recipient aggregates schema WITH bioguide_id column
-RECIPIENT_AGGREGATES_WITH_BIOGUIDE_SCHEMA = pa.schema(
-    [
-        pa.field("bioguide_id", pa.string()),  # Nullable - NULL for non-FEC records
-        pa.field("bonica.rid", pa.string(), nullable=False),
-        pa.field("recipient.name", pa.string()),
-        pa.field("recipient.party", pa.string()),
-        pa.field("recipient.type", pa.string()),
-        pa.field("recipient.state", pa.string()),
-        pa.field("candidate.cfscore", pa.float64()),
-        pa.field("total_amount", pa.float64()),
-        pa.field("avg_amount", pa.float64()),
-        pa.field("contribution_count", pa.int64()),
-        pa.field("individual_total", pa.float64()),
-        pa.field("individual_count", pa.int64()),
-        pa.field("organizational_total", pa.float64()),
-        pa.field("organizational_count", pa.int64()),
-    ]
 )
 
-RECIPIENT_AGGREGATES_WITH_BIOGUIDE_COLUMNS = [
+
+# Recipient aggregates schema WITH bioguide_id column
+@functools.cache
+def recipient_aggregates_with_bioguide_schema() -> pa.Schema:
+    """Arrow schema of the recipient aggregates output with bioguide_id."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field("bioguide_id", pa.string()),  # Nullable - NULL for non-FEC records
+            pa.field("bonica.rid", pa.string(), nullable=False),
+            pa.field("recipient.name", pa.string()),
+            pa.field("recipient.party", pa.string()),
+            pa.field("recipient.type", pa.string()),
+            pa.field("recipient.state", pa.string()),
+            pa.field("candidate.cfscore", pa.float64()),
+            pa.field("total_amount", pa.float64()),
+            pa.field("avg_amount", pa.float64()),
+            pa.field("contribution_count", pa.int64()),
+            pa.field("individual_total", pa.float64()),
+            pa.field("individual_count", pa.int64()),
+            pa.field("organizational_total", pa.float64()),
+            pa.field("organizational_count", pa.int64()),
+        ]
+    )
+
+
+RECIPIENT_AGGREGATES_WITH_BIOGUIDE_COLUMNS = (
     "bioguide_id",
     "bonica.rid",
     "recipient.name",
@@ -397,26 +460,33 @@ RECIPIENT_AGGREGATES_WITH_BIOGUIDE_COLUMNS = [
     "individual_count",
     "organizational_total",
     "organizational_count",
-]
+)
+
 
 # Raw organizational contributions schema (NEW)
 # Detailed contribution records filtered to organizational contributors only
-RAW_ORGANIZATIONAL_CONTRIBUTIONS_SCHEMA = pa.schema(
-    [
-        pa.field("bioguide_id", pa.string()),  # Nullable - NULL for non-FEC records
-        pa.field("cycle", pa.int64()),
-        pa.field("bonica.rid", pa.string()),
-        pa.field("recipient.name", pa.string()),
-        pa.field("contributor_name", pa.string()),
-        pa.field("contributor_type", pa.string()),
-        pa.field("contributor_id", pa.string()),
-        pa.field("amount", pa.float64()),
-        pa.field("date", pa.string()),
-        pa.field("contributor_state", pa.string()),
-    ]
-)
-
-RAW_ORGANIZATIONAL_CONTRIBUTIONS_COLUMNS = [
+@functools.cache
+def raw_organizational_contributions_schema() -> pa.Schema:
+    """Arrow schema of the raw organizational contributions output."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field("bioguide_id", pa.string()),  # Nullable - NULL for non-FEC records
+            pa.field("cycle", pa.int64()),
+            pa.field("bonica.rid", pa.string()),
+            pa.field("recipient.name", pa.string()),
+            pa.field("contributor_name", pa.string()),
+            pa.field("contributor_type", pa.string()),
+            pa.field("contributor_id", pa.string()),
+            pa.field("amount", pa.float64()),
+            pa.field("date", pa.string()),
+            pa.field("contributor_state", pa.string()),
+        ]
+    )
+
+
+RAW_ORGANIZATIONAL_CONTRIBUTIONS_COLUMNS = (
     "bioguide_id",
     "cycle",
     "bonica.rid",
@@ -427,7 +497,7 @@ RAW_ORGANIZATIONAL_CONTRIBUTIONS_COLUMNS = [
     "amount",
     "date",
     "contributor_state",
-]
+)
 
 # =============================================================================
 # OUTPUT FILE NAMING
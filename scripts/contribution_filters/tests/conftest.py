@@ -0,0 +1,92 @@
+"""Shared pytest fixtures for contribution_filters tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import duckdb
+import pytest
+
+
+@pytest.fixture(scope="session")
+def conn() -> Iterator[duckdb.DuckDBPyConnection]:
+    """In-memory DuckDB connection shared by the whole test session.
+
+    Tests use it to write input parquet files and read outputs back, so each
+    test does not pay for bringing up its own database. The tables involved
+    are a few rows, so it runs single-threaded; insertion order is kept
+    because tests assert on the order of rows read back.
+    """
+    connection = duckdb.connect(":memory:")
+    connection.execute("SET threads = 1")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def fixtures_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory for input files written once and shared by the whole session."""
+    return tmp_path_factory.mktemp("fixtures")
+
+
+@pytest.fixture(scope="session")
+def mock_contributions(fixtures_dir: Path, conn: duckdb.DuckDBPyConnection) -> Path:
+    """Mock contributions parquet file."""
+    contributions_path = fixtures_dir / "contributions.parquet"
+
+    # Create mock contributions data with organizational and individual contributors
+    conn.execute(f"""
+        COPY (
+            SELECT * FROM (VALUES
+                (2020, 'rid001', 'Recipient One', 'PAC Corp', 'C',
+                 'cid001', 1000.0, '2020-01-15', 'DC'),
+                (2020, 'rid002', 'Recipient Two', 'Union ABC', 'L',
+                 'cid002', 500.0, '2020-02-20', 'VA'),
+                (2020, 'rid001', 'Recipient One', 'John Doe', 'I',
+                 'cid003', 100.0, '2020-03-10', 'MD'),
+                (2020, 'rid003', 'Recipient Three', 'Corp XYZ', 'C',
+                 'cid004', 2000.0, '2020-04-05', 'NY')
+            ) t(cycle, "bonica.rid", "recipient.name", "contributor.name",
+                "contributor.type", "bonica.cid", amount, date, "contributor.state")
+        ) TO '{contributions_path}'
+        (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
+    """)
+    return contributions_path
+
+
+@pytest.fixture(scope="session")
+def mock_legislators(fixtures_dir: Path, conn: duckdb.DuckDBPyConnection) -> Path:
+    """Mock legislators parquet file."""
+    legislators_path = fixtures_dir / "legislators.parquet"
+
+    # Create mock legislators with FEC IDs
+    conn.execute(f"""
+        COPY (
+            SELECT * FROM (VALUES
+                ('A000001', ['H0DC00001'], 'Smith', 'John'),
+                ('B000002', ['S0VA00002'], 'Jones', 'Jane')
+            ) t(bioguide_id, fec_ids, last_name, first_name)
+        ) TO '{legislators_path}'
+        (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
+    """)
+    return legislators_path
+
+
+@pytest.fixture(scope="session")
+def mock_recipients(fixtures_dir: Path, conn: duckdb.DuckDBPyConnection) -> Path:
+    """Mock recipients parquet file."""
+    recipients_path = fixtures_dir / "recipients.parquet"
+
+    # Create mock recipients with ICPSR codes matching the contributions
+    conn.execute(f"""
+        COPY (
+            SELECT * FROM (VALUES
+                ('rid001', 'Recipient One', 'H0DC000012020'),
+                ('rid002', 'Recipient Two', 'S0VA000022020'),
+                ('rid003', 'Recipient Three', 'cand12345')
+            ) t("bonica.rid", "recipient.name", "ICPSR")
+        ) TO '{recipients_path}'
+        (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
+    """)
+    return recipients_path
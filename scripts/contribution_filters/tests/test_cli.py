@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
-from contribution_filters.cli import _format_size, main
+from contribution_filters.cli import _format_size, _list_filenames, main
 
 
 class TestFormatSize:
@@ -30,6 +32,26 @@ class TestFormatSize:
         """Sizes 1GB and above should show GB."""
         assert _format_size(1024 * 1024 * 1024) == "1.00 GB"
         assert _format_size(2 * 1024 * 1024 * 1024) == "2.00 GB"
+        assert _format_size(2048 * 1024 * 1024 * 1024) == "2048.00 GB"
+
+    def test_unit_boundaries(self) -> None:
+        """The last value below each boundary should stay in the smaller unit."""
+        assert _format_size(1024 * 1024 - 1) == "1024.0 KB"
+        assert _format_size(1024 * 1024 * 1024 - 1) == "1024.0 MB"
+
+
+class TestListFilenames:
+    """Tests for _list_filenames helper function."""
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """A missing directory should yield an empty set."""
+        assert _list_filenames(tmp_path / "missing") == set()
+
+    def test_lists_files_only(self, tmp_path: Path) -> None:
+        """Only regular files should be listed."""
+        (tmp_path / "a.parquet").touch()
+        (tmp_path / "subdir").mkdir()
+        assert _list_filenames(tmp_path) == {"a.parquet"}
 
 
 class TestCLIArguments:
@@ -73,6 +95,29 @@ class TestCLIArguments:
         captured = capsys.readouterr()
         assert "sample-size" in captured.err
 
+    def test_zero_workers(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Zero workers should exit with error."""
+        result = main(["output/", "--cycle", "2020", "--workers", "0"])
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "workers" in captured.err
+
+    def test_workers_with_delay(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """--delay only applies to serial runs."""
+        result = main(["output/", "--all", "--workers", "2", "--delay", "5"])
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "--delay" in captured.err
+
+    def test_cache_dir_outside_allowed_directories(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--cache-dir outside the local-path allowlist should exit with error."""
+        result = main(["output/", "--cycle", "2020", "--cache-dir", "/nonexistent/cache"])
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "cache-dir" in captured.err
+
     def test_start_cycle_without_end(self, capsys: pytest.CaptureFixture[str]) -> None:
         """--start-cycle without --end-cycle should exit with error."""
         result = main(["output/", "--start-cycle", "2000"])
@@ -103,3 +148,39 @@ class TestCLIArguments:
         assert result == 1
         captured = capsys.readouterr()
         assert "not found" in captured.err
+
+
+class TestSkipExisting:
+    """Tests for --skip-existing handling."""
+
+    def test_skips_cycle_when_all_outputs_exist(self, tmp_path: Path) -> None:
+        """Existing outputs should be skipped without touching the source."""
+        (tmp_path / "organizational").mkdir()
+        (tmp_path / "organizational" / "contribDB_2020_organizational.parquet").touch()
+        (tmp_path / "recipient_aggregates").mkdir()
+        (tmp_path / "recipient_aggregates" / "recipient_aggregates_2020.parquet").touch()
+
+        result = main([str(tmp_path), "--cycle", "2020", "--skip-existing"])
+        assert result == 0
+
+    def test_skips_cycles_with_workers(self, tmp_path: Path) -> None:
+        """Parallel runs should apply the same skip logic to every cycle."""
+        (tmp_path / "organizational").mkdir()
+        (tmp_path / "recipient_aggregates").mkdir()
+        for cycle in (2018, 2020):
+            (tmp_path / "organizational" / f"contribDB_{cycle}_organizational.parquet").touch()
+            (tmp_path / "recipient_aggregates" / f"recipient_aggregates_{cycle}.parquet").touch()
+
+        result = main(
+            [
+                str(tmp_path),
+                "--start-cycle",
+                "2018",
+                "--end-cycle",
+                "2020",
+                "--skip-existing",
+                "--workers",
+                "2",
+            ]
+        )
+        assert result == 0
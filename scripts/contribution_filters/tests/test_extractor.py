@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import duckdb
 import pytest
 
-from contribution_filters.exceptions import InvalidCycleError, InvalidSourceURLError
+from contribution_filters.exceptions import (
+    CompletenessError,
+    InvalidCycleError,
+    InvalidSourceURLError,
+    OutputWriteError,
+    SourceReadError,
+)
 from contribution_filters.extractor import (
+    Compression,
     ExtractionResult,
     OutputType,
+    _connect,
+    _log_bioguide_coverage,
+    download_source,
+    export_to_duckdb,
+    extract_organizational_and_aggregates,
+    extract_organizational_contributions,
     extract_raw_organizational_contributions,
 )
 
@@ -19,80 +34,50 @@ class TestExtractRawOrganizationalContributions:
     """Tests for extract_raw_organizational_contributions function."""
 
     @pytest.fixture
-    def mock_contributions(self, tmp_path: Path) -> Path:
-        """Create a mock contributions parquet file."""
-        conn = duckdb.connect()
-        contributions_path = tmp_path / "contributions.parquet"
-
-        # Create mock contributions data with organizational and individual contributors
-        conn.execute(f"""
-            COPY (
-                SELECT
-                    2020 as cycle,
-                    'rid001' as "bonica.rid",
-                    'Recipient One' as "recipient.name",
-                    'PAC Corp' as "contributor.name",
-                    'C' as "contributor.type",
-                    'cid001' as "bonica.cid",
-                    1000.0 as amount,
-                    '2020-01-15' as date,
-                    'DC' as "contributor.state"
-                UNION ALL
-                SELECT 2020, 'rid002', 'Recipient Two', 'Union ABC', 'L',
-                       'cid002', 500.0, '2020-02-20', 'VA'
-                UNION ALL
-                SELECT 2020, 'rid001', 'Recipient One', 'John Doe', 'I',
-                       'cid003', 100.0, '2020-03-10', 'MD'
-                UNION ALL
-                SELECT 2020, 'rid003', 'Recipient Three', 'Corp XYZ', 'C',
-                       'cid004', 2000.0, '2020-04-05', 'NY'
-            ) TO '{contributions_path}' (FORMAT PARQUET)
-        """)
-        conn.close()
-        return contributions_path
-
-    @pytest.fixture
-    def mock_legislators(self, tmp_path: Path) -> Path:
-        """Create a mock legislators parquet file."""
-        conn = duckdb.connect()
-        legislators_path = tmp_path / "legislators.parquet"
+    def patched_paths(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_contributions: Path,
+        mock_recipients: Path,
+    ) -> None:
+        """Point the recipients lookup at the mock file and allow the mock source."""
+        import contribution_filters.extractor as extractor_module
+        import contribution_filters.schema as schema_module
 
-        # Create mock legislators with FEC IDs
-        conn.execute(f"""
-            COPY (
-                SELECT
-                    'A000001' as bioguide_id,
-                    ['H0DC00001'] as fec_ids,
-                    'Smith' as last_name,
-                    'John' as first_name
-                UNION ALL
-                SELECT 'B000002', ['S0VA00002'], 'Jones', 'Jane'
-            ) TO '{legislators_path}' (FORMAT PARQUET)
-        """)
-        conn.close()
-        return legislators_path
+        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(mock_recipients))
+        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(mock_recipients))
+        monkeypatch.setattr(
+            schema_module,
+            "ALLOWED_LOCAL_DIRECTORIES",
+            ("/tmp/", str(mock_contributions.parent) + "/"),
+        )
 
-    @pytest.fixture
-    def mock_recipients(self, tmp_path: Path) -> Path:
-        """Create a mock recipients parquet file."""
-        conn = duckdb.connect()
-        recipients_path = tmp_path / "recipients.parquet"
+    @pytest.fixture(scope="class")
+    def raw_extraction(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        mock_recipients: Path,
+    ) -> ExtractionResult:
+        """Extract the mock contributions once for the tests that only inspect the result."""
+        import contribution_filters.extractor as extractor_module
+        import contribution_filters.schema as schema_module
 
-        # Create mock recipients with ICPSR codes matching the contributions
-        conn.execute(f"""
-            COPY (
-                SELECT
-                    'rid001' as "bonica.rid",
-                    'Recipient One' as "recipient.name",
-                    'H0DC000012020' as "ICPSR"
-                UNION ALL
-                SELECT 'rid002', 'Recipient Two', 'S0VA000022020'
-                UNION ALL
-                SELECT 'rid003', 'Recipient Three', 'cand12345'
-            ) TO '{recipients_path}' (FORMAT PARQUET)
-        """)
-        conn.close()
-        return recipients_path
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(mock_recipients))
+            monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(mock_recipients))
+            monkeypatch.setattr(
+                schema_module,
+                "ALLOWED_LOCAL_DIRECTORIES",
+                ("/tmp/", str(mock_contributions.parent) + "/"),
+            )
+            return extract_raw_organizational_contributions(
+                output_path=tmp_path_factory.mktemp("raw_extraction") / "output.parquet",
+                cycle=2020,
+                legislators_path=mock_legislators,
+                source_url=str(mock_contributions),
+            )
 
     def test_invalid_cycle_raises_error(self, tmp_path: Path, mock_legislators: Path) -> None:
         """Invalid cycle should raise InvalidCycleError."""
@@ -121,157 +106,398 @@ class TestExtractRawOrganizationalContributions:
 
         assert "evil.com" in exc_info.value.source_url
 
-    def test_extraction_result_type(
+    def test_extraction_result_type(self, raw_extraction: ExtractionResult) -> None:
+        """Extraction should return correct result type."""
+        assert isinstance(raw_extraction, ExtractionResult)
+        assert raw_extraction.output_type == OutputType.RAW_ORGANIZATIONAL
+        assert raw_extraction.cycle == 2020
+        assert raw_extraction.output_path.name == "output.parquet"
+        assert raw_extraction.validation.all_valid is True
+
+    def test_filters_individual_contributors(
+        self, conn: duckdb.DuckDBPyConnection, raw_extraction: ExtractionResult
+    ) -> None:
+        """Extraction should filter out individual contributors."""
+        output_path = raw_extraction.output_path
+
+        # Source has 4 rows, 1 is individual (type='I'), so output should have 3
+        assert raw_extraction.source_rows == 4
+        assert raw_extraction.output_count == 3
+
+        # Verify no individuals in output, and rows are sorted by contributor type
+        individual_count = conn.execute(f"""
+            SELECT COUNT(*) FROM read_parquet('{output_path}')
+            WHERE contributor_type = 'I'
+        """).fetchone()[0]
+        types = conn.execute(f"""
+            SELECT contributor_type FROM read_parquet('{output_path}')
+        """).fetchall()
+
+        assert individual_count == 0
+        assert [t[0] for t in types] == ["C", "C", "L"]
+
+    def test_includes_bioguide_id(
+        self, conn: duckdb.DuckDBPyConnection, raw_extraction: ExtractionResult
+    ) -> None:
+        """Output should include bioguide_id column."""
+        output_path = raw_extraction.output_path
+
+        # Verify bioguide_id column exists
+        columns = conn.execute(f"""
+            SELECT column_name FROM (DESCRIBE SELECT * FROM read_parquet('{output_path}'))
+        """).fetchall()
+
+        column_names = [c[0] for c in columns]
+        assert "bioguide_id" in column_names
+
+    def test_organizational_output_keeps_source_columns(
         self,
         tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
         mock_contributions: Path,
         mock_legislators: Path,
-        mock_recipients: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        patched_paths: None,
     ) -> None:
-        """Extraction should return correct result type."""
-        # Patch the RECIPIENTS_URL and ALLOWED_LOCAL_DIRECTORIES to use our mocks
-        import contribution_filters.extractor as extractor_module
-        import contribution_filters.schema as schema_module
-
-        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(mock_recipients))
-        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(mock_recipients))
-        monkeypatch.setattr(
-            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ["/tmp/", str(tmp_path) + "/"]
-        )
-
+        """Unlike the raw output, organizational output keeps every source column."""
         output_path = tmp_path / "output.parquet"
 
-        result = extract_raw_organizational_contributions(
+        extract_organizational_contributions(
             output_path=output_path,
             cycle=2020,
-            legislators_path=mock_legislators,
             source_url=str(mock_contributions),
-            validate=False,  # Skip validation for this test
+            legislators_path=mock_legislators,
+            validate=False,
         )
 
-        assert isinstance(result, ExtractionResult)
-        assert result.output_type == OutputType.RAW_ORGANIZATIONAL
-        assert result.cycle == 2020
-        assert result.output_path == output_path
+        source_columns = conn.execute(f"""
+            SELECT column_name FROM (DESCRIBE SELECT * FROM read_parquet('{mock_contributions}'))
+        """).fetchall()
+        output_columns = conn.execute(f"""
+            SELECT column_name FROM (DESCRIBE SELECT * FROM read_parquet('{output_path}'))
+        """).fetchall()
+
+        assert output_columns == [("bioguide_id",), *source_columns]
 
-    def test_filters_individual_contributors(
+    def test_legislators_path_with_quote(
         self,
         tmp_path: Path,
         mock_contributions: Path,
         mock_legislators: Path,
-        mock_recipients: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        patched_paths: None,
     ) -> None:
-        """Extraction should filter out individual contributors."""
-        import contribution_filters.extractor as extractor_module
-        import contribution_filters.schema as schema_module
+        """Lookup paths are bound as parameters, so quotes need no escaping."""
+        quoted_dir = tmp_path / "o'neill"
+        quoted_dir.mkdir()
+        legislators_path = Path(shutil.copy(mock_legislators, quoted_dir / "legislators.parquet"))
 
-        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(mock_recipients))
-        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(mock_recipients))
-        monkeypatch.setattr(
-            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ["/tmp/", str(tmp_path) + "/"]
+        result = extract_raw_organizational_contributions(
+            output_path=tmp_path / "output.parquet",
+            cycle=2020,
+            legislators_path=legislators_path,
+            source_url=str(mock_contributions),
         )
 
-        output_path = tmp_path / "output.parquet"
+        assert result.output_count == 3
+
+    def test_source_and_output_paths_with_quote(
+        self,
+        tmp_path: Path,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+    ) -> None:
+        """Quotes in the source and output paths should not break the SQL."""
+        quoted_dir = tmp_path / "o'neill"
+        quoted_dir.mkdir()
+        source_path = Path(shutil.copy(mock_contributions, quoted_dir / "contribDB_2020.parquet"))
 
         result = extract_raw_organizational_contributions(
-            output_path=output_path,
+            output_path=quoted_dir / "output.parquet",
             cycle=2020,
             legislators_path=mock_legislators,
-            source_url=str(mock_contributions),
-            validate=False,
+            source_url=str(source_path),
         )
 
-        # Source has 4 rows, 1 is individual (type='I'), so output should have 3
-        assert result.source_rows == 4
         assert result.output_count == 3
+        assert (quoted_dir / "output.parquet").exists()
 
-        # Verify no individuals in output
-        conn = duckdb.connect()
-        individual_count = conn.execute(f"""
-            SELECT COUNT(*) FROM read_parquet('{output_path}')
-            WHERE contributor_type = 'I'
-        """).fetchone()[0]
-        conn.close()
+    def test_bioguide_lookup_built_once(
+        self,
+        tmp_path: Path,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Repeated extractions with the same lookup files should share one lookup table."""
+        import contribution_filters.extractor as extractor_module
 
-        assert individual_count == 0
+        monkeypatch.setattr(extractor_module, "_bioguide_lookups", {})
 
-    def test_includes_bioguide_id(
+        for name in ("first.parquet", "second.parquet"):
+            extract_raw_organizational_contributions(
+                output_path=tmp_path / name,
+                cycle=2020,
+                legislators_path=mock_legislators,
+                source_url=str(mock_contributions),
+            )
+
+        assert len(extractor_module._bioguide_lookups) == 1
+
+    def test_missing_legislators_raises_error(
         self,
         tmp_path: Path,
         mock_contributions: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An unreadable legislators file should raise SourceReadError."""
+        import contribution_filters.schema as schema_module
+
+        monkeypatch.setattr(
+            schema_module,
+            "ALLOWED_LOCAL_DIRECTORIES",
+            ("/tmp/", str(mock_contributions.parent) + "/"),
+        )
+
+        with pytest.raises(SourceReadError):
+            extract_raw_organizational_contributions(
+                output_path=tmp_path / "output.parquet",
+                cycle=2020,
+                legislators_path=tmp_path / "missing.parquet",
+                source_url=str(mock_contributions),
+            )
+        assert not (tmp_path / "output.parquet").exists()
+
+    def test_recipient_with_unmatched_icpsr_row_not_duplicated(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        mock_contributions: Path,
         mock_legislators: Path,
-        mock_recipients: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Output should include bioguide_id column."""
+        """A recipient with matched and unmatched ICPSR rows should not duplicate records."""
         import contribution_filters.extractor as extractor_module
         import contribution_filters.schema as schema_module
 
-        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(mock_recipients))
-        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(mock_recipients))
+        recipients_path = tmp_path / "recipients.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 'H0DC000012020' as "ICPSR"
+                UNION ALL
+                SELECT 'rid001', 'cand12345'
+            ) TO '{recipients_path}' (FORMAT PARQUET)
+        """)
+
+        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(recipients_path))
+        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(recipients_path))
         monkeypatch.setattr(
-            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ["/tmp/", str(tmp_path) + "/"]
+            schema_module,
+            "ALLOWED_LOCAL_DIRECTORIES",
+            ("/tmp/", str(mock_contributions.parent) + "/"),
         )
 
         output_path = tmp_path / "output.parquet"
-
-        extract_raw_organizational_contributions(
+        result = extract_raw_organizational_contributions(
             output_path=output_path,
             cycle=2020,
             legislators_path=mock_legislators,
             source_url=str(mock_contributions),
-            validate=False,
         )
 
-        # Verify bioguide_id column exists
-        conn = duckdb.connect()
-        columns = conn.execute(f"""
-            SELECT column_name FROM (DESCRIBE SELECT * FROM read_parquet('{output_path}'))
+        rid001 = conn.execute(f"""
+            SELECT bioguide_id FROM read_parquet('{output_path}')
+            WHERE "bonica.rid" = 'rid001'
         """).fetchall()
-        conn.close()
 
-        column_names = [c[0] for c in columns]
-        assert "bioguide_id" in column_names
+        assert result.output_count == 3
+        assert rid001 == [("A000001",)]
 
-    def test_bioguide_id_matches_legislators(
+    def test_recipient_matching_several_legislators_not_duplicated(
         self,
         tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
         mock_contributions: Path,
-        mock_legislators: Path,
         mock_recipients: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """bioguide_id values should match legislators via FEC ID join."""
+        """A recipient whose FEC ID matches two legislators keeps one row per record."""
         import contribution_filters.extractor as extractor_module
         import contribution_filters.schema as schema_module
 
+        legislators_path = tmp_path / "shared_fec_legislators.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'B000009' as bioguide_id, ['H0DC00001'] as fec_ids
+                UNION ALL
+                SELECT 'A000001', ['H0DC00001']
+            ) TO '{legislators_path}' (FORMAT PARQUET)
+        """)
+
         monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(mock_recipients))
         monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(mock_recipients))
         monkeypatch.setattr(
-            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ["/tmp/", str(tmp_path) + "/"]
+            schema_module,
+            "ALLOWED_LOCAL_DIRECTORIES",
+            ("/tmp/", str(mock_contributions.parent) + "/"),
         )
 
         output_path = tmp_path / "output.parquet"
+        result = extract_raw_organizational_contributions(
+            output_path=output_path,
+            cycle=2020,
+            legislators_path=legislators_path,
+            source_url=str(mock_contributions),
+        )
+
+        rid001 = conn.execute(f"""
+            SELECT bioguide_id FROM read_parquet('{output_path}')
+            WHERE "bonica.rid" = 'rid001'
+        """).fetchall()
 
+        assert result.output_count == 3
+        assert rid001 == [("A000001",)]
+
+    def test_identical_source_rows_kept(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+    ) -> None:
+        """Identical contribution rows are separate records and should both be kept."""
+        source_path = tmp_path / "contribDB_2020.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT * FROM read_parquet('{mock_contributions}')
+                UNION ALL
+                SELECT * FROM read_parquet('{mock_contributions}')
+                WHERE "bonica.cid" = 'cid001'
+            ) TO '{source_path}' (FORMAT PARQUET)
+        """)
+
+        raw = extract_raw_organizational_contributions(
+            output_path=tmp_path / "raw.parquet",
+            cycle=2020,
+            legislators_path=mock_legislators,
+            source_url=str(source_path),
+        )
+        org = extract_organizational_contributions(
+            output_path=tmp_path / "org.parquet",
+            cycle=2020,
+            legislators_path=mock_legislators,
+            source_url=str(source_path),
+        )
+
+        duplicates = [
+            conn.execute(f"""
+                SELECT COUNT(*) FROM read_parquet('{result.output_path}')
+                WHERE "bonica.rid" = 'rid001' AND bioguide_id = 'A000001'
+            """).fetchone()
+            for result in (raw, org)
+        ]
+
+        assert raw.output_count == org.output_count == 4
+        assert duplicates == [(2,), (2,)]
+
+    def test_prefetch_matches_direct_read(
+        self,
+        tmp_path: Path,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+    ) -> None:
+        """Staging the source locally should not change the extraction result."""
+        result = extract_raw_organizational_contributions(
+            output_path=tmp_path / "output.parquet",
+            cycle=2020,
+            legislators_path=mock_legislators,
+            source_url=str(mock_contributions),
+            prefetch=True,
+        )
+
+        assert result.source_url == str(mock_contributions)
+        assert result.source_rows == 4
+        assert result.output_count == 3
+
+    def test_compression_option(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+    ) -> None:
+        """The requested compression codec should be used for the output."""
+        output_path = tmp_path / "output.parquet"
         extract_raw_organizational_contributions(
             output_path=output_path,
             cycle=2020,
             legislators_path=mock_legislators,
             source_url=str(mock_contributions),
-            validate=False,
+            compression=Compression.LZ4_RAW,
         )
 
+        codecs = conn.execute(f"""
+            SELECT DISTINCT compression FROM parquet_metadata('{output_path}')
+        """).fetchall()
+
+        assert codecs == [("LZ4_RAW",)]
+
+    def test_repeated_prefetch_extractions(
+        self,
+        tmp_path: Path,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+    ) -> None:
+        """Staged tables should not leak between extractions on the shared database."""
+        for name in ("first.parquet", "second.parquet"):
+            result = extract_raw_organizational_contributions(
+                output_path=tmp_path / name,
+                cycle=2020,
+                legislators_path=mock_legislators,
+                source_url=str(mock_contributions),
+                prefetch=True,
+            )
+            assert result.output_count == 3
+        assert result.validation.all_valid is True
+
+    def test_logs_bioguide_coverage(
+        self,
+        tmp_path: Path,
+        mock_contributions: Path,
+        mock_legislators: Path,
+        patched_paths: None,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Coverage should be derived from the written file's null statistics."""
+        with caplog.at_level("INFO", logger="contribution_filters.extractor"):
+            extract_raw_organizational_contributions(
+                output_path=tmp_path / "output.parquet",
+                cycle=2020,
+                legislators_path=mock_legislators,
+                source_url=str(mock_contributions),
+                validate=False,
+            )
+
+        # rid001 and rid002 link to legislators, rid003 does not
+        assert "Bioguide ID coverage: 2/3" in caplog.text
+
+    def test_bioguide_id_matches_legislators(
+        self, conn: duckdb.DuckDBPyConnection, raw_extraction: ExtractionResult
+    ) -> None:
+        """bioguide_id values should match legislators via FEC ID join."""
+        output_path = raw_extraction.output_path
+
         # Check that matched records have correct bioguide_ids
-        conn = duckdb.connect()
         matched = conn.execute(f"""
             SELECT "bonica.rid", bioguide_id
             FROM read_parquet('{output_path}')
             WHERE bioguide_id IS NOT NULL
             ORDER BY "bonica.rid"
         """).fetchall()
-        conn.close()
 
         # rid001 should match A000001 (via H0DC000012020 ICPSR)
         # rid002 should match B000002 (via S0VA000022020 ICPSR)
@@ -279,3 +505,482 @@ class TestExtractRawOrganizationalContributions:
         rid_to_bioguide = {r[0]: r[1] for r in matched}
         assert rid_to_bioguide.get("rid001") == "A000001"
         assert rid_to_bioguide.get("rid002") == "B000002"
+
+
+class TestExtractOrganizationalAndAggregates:
+    """Tests for extract_organizational_and_aggregates function."""
+
+    @pytest.fixture
+    def mock_contributions(self, tmp_path: Path, conn: duckdb.DuckDBPyConnection) -> Path:
+        """Create a mock contributions parquet file with recipient columns."""
+        contributions_path = tmp_path / "contributions.parquet"
+
+        conn.execute(f"""
+            COPY (
+                SELECT
+                    'rid001' as "bonica.rid",
+                    'Recipient One' as "recipient.name",
+                    '100' as "recipient.party",
+                    'CAND' as "recipient.type",
+                    'DC' as "recipient.state",
+                    -0.5 as "candidate.cfscore",
+                    'C' as "contributor.type",
+                    1000.0::DOUBLE as amount
+                UNION ALL
+                SELECT 'rid001', 'Recipient One', '100', 'CAND', 'DC', -0.5, 'I', 100.0
+                UNION ALL
+                SELECT 'rid002', 'Recipient Two', '200', 'CAND', 'VA', 0.5, 'I', 250.0
+                UNION ALL
+                SELECT 'rid002', 'Recipient Two', '200', 'CAND', 'VA', 0.5, 'L', 500.0
+            ) TO '{contributions_path}' (FORMAT PARQUET)
+        """)
+        return contributions_path
+
+    def test_invalid_cycle_raises_error(self, tmp_path: Path) -> None:
+        """Invalid cycle should raise InvalidCycleError."""
+        with pytest.raises(InvalidCycleError):
+            extract_organizational_and_aggregates(
+                tmp_path / "org.parquet",
+                tmp_path / "agg.parquet",
+                cycle=2025,
+            )
+
+    def test_writes_both_outputs(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        mock_contributions: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Both outputs should match what the single-output extractors produce."""
+        import contribution_filters.schema as schema_module
+
+        monkeypatch.setattr(
+            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ("/tmp/", str(tmp_path) + "/")
+        )
+
+        org_result, agg_result = extract_organizational_and_aggregates(
+            tmp_path / "org.parquet",
+            tmp_path / "agg.parquet",
+            cycle=2020,
+            source_url=str(mock_contributions),
+        )
+
+        assert org_result.output_type == OutputType.ORGANIZATIONAL
+        assert org_result.source_rows == 4
+        assert org_result.output_count == 2
+        assert org_result.validation.all_valid is True
+
+        assert agg_result.output_type == OutputType.RECIPIENT_AGGREGATES
+        assert agg_result.source_rows == 4
+        assert agg_result.output_count == 2
+        assert agg_result.validation.aggregation_sample_size == 2
+
+        totals = conn.execute(f"""
+            SELECT "bonica.rid", total_amount, individual_count, organizational_count
+            FROM read_parquet('{agg_result.output_path}')
+            ORDER BY "bonica.rid"
+        """).fetchall()
+        count_types = conn.execute(f"""
+            SELECT column_type FROM (
+                DESCRIBE SELECT individual_count, organizational_count
+                FROM read_parquet('{agg_result.output_path}')
+            )
+        """).fetchall()
+
+        assert totals == [("rid001", 1100.0, 1, 1), ("rid002", 750.0, 1, 1)]
+        assert count_types == [("BIGINT",), ("BIGINT",)]
+
+    def test_low_cardinality_columns_dictionary_encoded(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Recipient party/type/state should be stored with dictionary encoding."""
+        import contribution_filters.schema as schema_module
+
+        monkeypatch.setattr(
+            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ("/tmp/", str(tmp_path) + "/")
+        )
+
+        # Enough recipients for the writer to choose dictionary pages
+        source_path = tmp_path / "contributions.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT
+                    'rid' || (i % 500) as "bonica.rid",
+                    'Recipient ' || (i % 500) as "recipient.name",
+                    ['100', '200', '328'][i % 3 + 1] as "recipient.party",
+                    'CAND' as "recipient.type",
+                    ['DC', 'VA', 'MD', 'NY'][i % 4 + 1] as "recipient.state",
+                    0.0::DOUBLE as "candidate.cfscore",
+                    ['I', 'C'][i % 2 + 1] as "contributor.type",
+                    10.0::DOUBLE as amount
+                FROM range(2000) t(i)
+            ) TO '{source_path}' (FORMAT PARQUET)
+        """)
+
+        _, agg_result = extract_organizational_and_aggregates(
+            tmp_path / "org.parquet",
+            tmp_path / "agg.parquet",
+            cycle=2020,
+            source_url=str(source_path),
+        )
+
+        encodings = conn.execute(f"""
+            SELECT path_in_schema, encodings
+            FROM parquet_metadata('{agg_result.output_path}')
+            WHERE path_in_schema IN ('recipient.party', 'recipient.type', 'recipient.state')
+        """).fetchall()
+
+        assert len(encodings) == 3
+        assert all("DICTIONARY" in encoding for _, encoding in encodings)
+
+    def test_aggregates_with_bioguide(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        mock_contributions: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Aggregates joined to legislators should keep one row per recipient."""
+        import contribution_filters.extractor as extractor_module
+        import contribution_filters.schema as schema_module
+
+        legislators_path = tmp_path / "legislators.parquet"
+        recipients_path = tmp_path / "recipients.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'A000001' as bioguide_id, ['H0DC00001'] as fec_ids
+            ) TO '{legislators_path}' (FORMAT PARQUET)
+        """)
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 'H0DC000012020' as "ICPSR"
+                UNION ALL
+                SELECT 'rid002', 'cand12345'
+            ) TO '{recipients_path}' (FORMAT PARQUET)
+        """)
+
+        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(recipients_path))
+        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(recipients_path))
+        monkeypatch.setattr(
+            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ("/tmp/", str(tmp_path) + "/")
+        )
+
+        _, agg_result = extract_organizational_and_aggregates(
+            tmp_path / "org.parquet",
+            tmp_path / "agg.parquet",
+            cycle=2020,
+            source_url=str(mock_contributions),
+            legislators_path=legislators_path,
+        )
+
+        rows = conn.execute(f"""
+            SELECT bioguide_id, "bonica.rid", total_amount
+            FROM read_parquet('{agg_result.output_path}')
+        """).fetchall()
+
+        assert rows == [("A000001", "rid001", 1100.0), (None, "rid002", 750.0)]
+
+    def test_writes_raw_output_from_same_source(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Raw output should match what extract_raw_organizational_contributions produces."""
+        import contribution_filters.extractor as extractor_module
+        import contribution_filters.schema as schema_module
+
+        contributions_path = tmp_path / "contributions.parquet"
+        legislators_path = tmp_path / "legislators.parquet"
+        recipients_path = tmp_path / "recipients.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT
+                    2020 as cycle,
+                    'rid001' as "bonica.rid",
+                    'Recipient One' as "recipient.name",
+                    '100' as "recipient.party",
+                    'CAND' as "recipient.type",
+                    'DC' as "recipient.state",
+                    -0.5 as "candidate.cfscore",
+                    'PAC Corp' as "contributor.name",
+                    'C' as "contributor.type",
+                    'cid001' as "bonica.cid",
+                    1000.0::DOUBLE as amount,
+                    '2020-01-15' as date,
+                    'DC' as "contributor.state"
+                UNION ALL
+                SELECT 2020, 'rid001', 'Recipient One', '100', 'CAND', 'DC', -0.5,
+                       'John Doe', 'I', 'cid002', 100.0, '2020-03-10', 'MD'
+                UNION ALL
+                SELECT 2020, 'rid002', 'Recipient Two', '200', 'CAND', 'VA', 0.5,
+                       'Union ABC', 'L', 'cid003', 500.0, '2020-02-20', 'VA'
+            ) TO '{contributions_path}' (FORMAT PARQUET)
+        """)
+        conn.execute(f"""
+            COPY (
+                SELECT 'A000001' as bioguide_id, ['H0DC00001'] as fec_ids
+            ) TO '{legislators_path}' (FORMAT PARQUET)
+        """)
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 'H0DC000012020' as "ICPSR"
+            ) TO '{recipients_path}' (FORMAT PARQUET)
+        """)
+
+        monkeypatch.setattr(schema_module, "RECIPIENTS_URL", str(recipients_path))
+        monkeypatch.setattr(extractor_module, "RECIPIENTS_URL", str(recipients_path))
+        monkeypatch.setattr(
+            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ("/tmp/", str(tmp_path) + "/")
+        )
+
+        results = extract_organizational_and_aggregates(
+            tmp_path / "org.parquet",
+            tmp_path / "agg.parquet",
+            cycle=2020,
+            source_url=str(contributions_path),
+            legislators_path=legislators_path,
+            raw_organizational_path=tmp_path / "raw.parquet",
+        )
+        expected = extract_raw_organizational_contributions(
+            tmp_path / "expected_raw.parquet",
+            cycle=2020,
+            legislators_path=legislators_path,
+            source_url=str(contributions_path),
+        )
+
+        assert [r.output_type for r in results] == [
+            OutputType.ORGANIZATIONAL,
+            OutputType.RECIPIENT_AGGREGATES,
+            OutputType.RAW_ORGANIZATIONAL,
+        ]
+        raw_result = results[2]
+        assert raw_result.source_rows == expected.source_rows == 3
+        assert raw_result.output_count == expected.output_count == 2
+        assert raw_result.validation.all_valid is True
+
+        raw_rows, expected_rows = (
+            conn.execute(f"SELECT * FROM read_parquet('{path}')").fetchall()
+            for path in (raw_result.output_path, expected.output_path)
+        )
+
+        assert raw_rows == expected_rows
+
+    def test_raw_output_requires_legislators_path(self, tmp_path: Path) -> None:
+        """Requesting raw output without legislators_path should raise ValueError."""
+        with pytest.raises(ValueError, match="legislators_path"):
+            extract_organizational_and_aggregates(
+                tmp_path / "org.parquet",
+                tmp_path / "agg.parquet",
+                cycle=2020,
+                raw_organizational_path=tmp_path / "raw.parquet",
+            )
+
+    def test_failed_validation_leaves_no_output(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Outputs that fail validation should not appear at their final path."""
+        import contribution_filters.schema as schema_module
+
+        monkeypatch.setattr(
+            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ("/tmp/", str(tmp_path) + "/")
+        )
+
+        # Only organizational rows: the filter cannot reduce the row count
+        contributions_path = tmp_path / "contributions.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 'Recipient One' as "recipient.name",
+                       '100' as "recipient.party", 'CAND' as "recipient.type",
+                       'DC' as "recipient.state", -0.5 as "candidate.cfscore",
+                       'C' as "contributor.type", 1000.0::DOUBLE as amount
+            ) TO '{contributions_path}' (FORMAT PARQUET)
+        """)
+
+        with pytest.raises(CompletenessError):
+            extract_organizational_and_aggregates(
+                tmp_path / "out" / "org.parquet",
+                tmp_path / "out" / "agg.parquet",
+                cycle=2020,
+                source_url=str(contributions_path),
+            )
+
+        assert list((tmp_path / "out").iterdir()) == []
+
+
+class TestConnect:
+    """Tests for _connect function."""
+
+    def test_metadata_caches_enabled(self) -> None:
+        """The shared connection should cache parquet footers and HTTP metadata."""
+        cursor = _connect()
+        try:
+            settings = cursor.execute("""
+                SELECT
+                    current_setting('parquet_metadata_cache'),
+                    current_setting('enable_http_metadata_cache')
+            """).fetchone()
+        finally:
+            cursor.close()
+
+        assert settings == (True, True)
+
+
+class TestDownloadSource:
+    """Tests for download_source function."""
+
+    def test_invalid_cycle_raises_error(self, tmp_path: Path) -> None:
+        """Invalid cycle should raise InvalidCycleError."""
+        with pytest.raises(InvalidCycleError):
+            download_source(2025, tmp_path)
+
+    def test_local_source_returned_unchanged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A local source is already local; nothing is copied into the cache."""
+        import contribution_filters.schema as schema_module
+
+        monkeypatch.setattr(
+            schema_module, "ALLOWED_LOCAL_DIRECTORIES", ("/tmp/", str(tmp_path) + "/")
+        )
+        source = tmp_path / "contributions.parquet"
+        source.touch()
+
+        assert download_source(2020, tmp_path / "cache", source_url=str(source)) == source
+        assert not (tmp_path / "cache").exists()
+
+    def test_cached_source_is_reused(self, tmp_path: Path) -> None:
+        """A source already in the cache directory should not be downloaded again."""
+        cached = tmp_path / "contribDB_2020.parquet"
+        cached.touch()
+
+        assert download_source(2020, tmp_path) == cached
+
+    def test_stalled_download_raises_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A download that times out should raise SourceReadError and leave no file."""
+        import contribution_filters.extractor as extractor_module
+
+        timeouts = []
+
+        def timed_out_urlopen(url: str, timeout: float | None = None) -> None:
+            timeouts.append(timeout)
+            raise TimeoutError("timed out")
+
+        monkeypatch.setattr(extractor_module.urllib.request, "urlopen", timed_out_urlopen)
+
+        with pytest.raises(SourceReadError, match="timed out"):
+            download_source(2020, tmp_path)
+
+        assert timeouts == [extractor_module.DOWNLOAD_TIMEOUT_SECONDS]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExportToDuckdb:
+    """Tests for export_to_duckdb function."""
+
+    def test_copies_parquet_into_table(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """The database table should hold the parquet rows in the same order."""
+        parquet_path = tmp_path / "recipient_aggregates_2020.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid002' as "bonica.rid", 750.0 as total_amount
+                UNION ALL
+                SELECT 'rid001', 100.0
+            ) TO '{parquet_path}' (FORMAT PARQUET)
+        """)
+
+        database_path = export_to_duckdb(
+            parquet_path, tmp_path / "recipient_aggregates_2020.duckdb"
+        )
+
+        db = duckdb.connect(str(database_path), read_only=True)
+        rows = db.execute('SELECT "bonica.rid" FROM recipient_aggregates').fetchall()
+        db.close()
+
+        assert rows == [("rid002",), ("rid001",)]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "recipient_aggregates_2020.duckdb",
+            "recipient_aggregates_2020.parquet",
+        ]
+
+    def test_missing_parquet_raises_error(self, tmp_path: Path) -> None:
+        """A failed export should raise OutputWriteError and leave no database behind."""
+        with pytest.raises(OutputWriteError):
+            export_to_duckdb(tmp_path / "missing.parquet", tmp_path / "out.duckdb")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_after_failed_export(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """A failed export should not break later exports in the same process."""
+        parquet_path = tmp_path / "recipient_aggregates_2020.parquet"
+        conn.execute(f"""
+            COPY (SELECT 'rid001' as "bonica.rid") TO '{parquet_path}' (FORMAT PARQUET)
+        """)
+        with pytest.raises(OutputWriteError):
+            export_to_duckdb(tmp_path / "missing.parquet", tmp_path / "missing.duckdb")
+
+        database_path = export_to_duckdb(parquet_path, tmp_path / "out.duckdb")
+
+        assert database_path.exists()
+
+    def test_concurrent_exports(self, tmp_path: Path, conn: duckdb.DuckDBPyConnection) -> None:
+        """Exports running in parallel should each write their own database."""
+        parquet_paths = []
+        for cycle in range(2000, 2016, 2):
+            parquet_path = tmp_path / f"recipient_aggregates_{cycle}.parquet"
+            conn.execute(f"""
+                COPY (SELECT 'rid{cycle}' as "bonica.rid") TO '{parquet_path}' (FORMAT PARQUET)
+            """)
+            parquet_paths.append(parquet_path)
+
+        with ThreadPoolExecutor(max_workers=len(parquet_paths)) as executor:
+            database_paths = list(
+                executor.map(
+                    lambda path: export_to_duckdb(path, path.with_suffix(".duckdb")),
+                    parquet_paths,
+                )
+            )
+
+        for parquet_path, database_path in zip(parquet_paths, database_paths, strict=True):
+            db = duckdb.connect(str(database_path), read_only=True)
+            rows = db.execute('SELECT "bonica.rid" FROM recipient_aggregates').fetchall()
+            db.close()
+            assert rows == [(f"rid{parquet_path.stem[-4:]}",)]
+
+
+class TestLogBioguideCoverage:
+    """Tests for _log_bioguide_coverage function."""
+
+    def test_counts_column_without_null_statistics(
+        self,
+        tmp_path: Path,
+        conn: duckdb.DuckDBPyConnection,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Coverage should be counted from the column when the footer lacks null counts."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output_path = tmp_path / "output.parquet"
+        pq.write_table(
+            pa.table({"bioguide_id": ["A000001", None, None, None]}),
+            output_path,
+            write_statistics=False,
+        )
+
+        with caplog.at_level("INFO", logger="contribution_filters.extractor"):
+            _log_bioguide_coverage(conn, output_path, 4)
+
+        assert "Bioguide ID coverage: 1/4 (25.0%)" in caplog.text
@@ -6,10 +6,15 @@ from contribution_filters.schema import (
     ALL_CYCLES,
     MAX_CYCLE,
     MIN_CYCLE,
-    escape_sql_string,
+    RAW_ORGANIZATIONAL_CONTRIBUTIONS_COLUMNS,
+    RECIPIENT_AGGREGATES_COLUMNS,
+    RECIPIENT_AGGREGATES_WITH_BIOGUIDE_COLUMNS,
     get_organizational_filename,
     get_raw_organizational_filename,
     get_recipient_aggregates_filename,
+    raw_organizational_contributions_schema,
+    recipient_aggregates_schema,
+    recipient_aggregates_with_bioguide_schema,
     validate_cycle,
     validate_path_string,
     validate_source_url,
@@ -45,27 +50,10 @@ class TestValidateCycle:
         assert len(ALL_CYCLES) == 23
         assert all(c % 2 == 0 for c in ALL_CYCLES)
 
-
-class TestEscapeSqlString:
-    """Tests for escape_sql_string function."""
-
-    def test_no_escaping_needed(self) -> None:
-        """Plain strings should pass through unchanged."""
-        assert escape_sql_string("simple_string") == "simple_string"
-        assert escape_sql_string("recipient123") == "recipient123"
-
-    def test_single_quotes_escaped(self) -> None:
-        """Single quotes should be doubled."""
-        assert escape_sql_string("O'Brien") == "O''Brien"
-        assert escape_sql_string("'quoted'") == "''quoted''"
-
-    def test_backslashes_escaped(self) -> None:
-        """Backslashes should be doubled."""
-        assert escape_sql_string("back\\slash") == "back\\\\slash"
-
-    def test_combined_escaping(self) -> None:
-        """Both quotes and backslashes should be escaped."""
-        assert escape_sql_string("O'Brien\\test") == "O''Brien\\\\test"
+    def test_matches_all_cycles(self) -> None:
+        """validate_cycle should accept exactly the years in ALL_CYCLES."""
+        accepted = [year for year in range(MIN_CYCLE - 10, MAX_CYCLE + 10) if validate_cycle(year)]
+        assert accepted == list(ALL_CYCLES)
 
 
 class TestValidatePathString:
@@ -84,6 +72,37 @@ class TestValidatePathString:
         assert validate_path_string("UNION SELECT * FROM secrets") is False
         assert validate_path_string("' OR '1'='1") is False
 
+    def test_each_pattern_rejected(self) -> None:
+        """Every dangerous pattern should be rejected on its own."""
+        for path in [
+            "file.parquet;--",
+            "file.parquet; DROP TABLE x",
+            "file.parquet;DELETE FROM x",
+            "file.parquet; INSERT INTO x",
+            "file.parquet; UPDATE x",
+            "x UNION  SELECT y",
+            "x'  OR  'y",
+        ]:
+            assert validate_path_string(path) is False, path
+
+    def test_patterns_case_insensitive(self) -> None:
+        """Lowercase and mixed-case injections should be rejected too."""
+        assert validate_path_string("file.parquet; drop table x") is False
+        assert validate_path_string("x union select y") is False
+        assert validate_path_string("x' Or 'y") is False
+
+    def test_keywords_without_context_allowed(self) -> None:
+        """Keywords are only dangerous in injection context."""
+        assert validate_path_string("/tmp/drop_update/union_select.parquet") is True
+        assert validate_path_string("/tmp/o'reilly/file.parquet") is True
+
+    def test_repeated_path_is_cached(self) -> None:
+        """Repeat validations of the same path are served from the cache."""
+        validate_path_string.cache_clear()
+        validate_path_string("/tmp/cached.parquet")
+        validate_path_string("/tmp/cached.parquet")
+        assert validate_path_string.cache_info().hits == 1
+
 
 class TestValidateSourceUrl:
     """Tests for validate_source_url function."""
@@ -93,6 +112,10 @@ class TestValidateSourceUrl:
         url = "https://huggingface.co/datasets/test/file.parquet"
         assert validate_source_url(url) is True
 
+    def test_lookalike_domain_prefix(self) -> None:
+        """A host that only starts with an allowed domain should be rejected."""
+        assert validate_source_url("https://huggingface.co.evil.com/file.parquet") is False
+
     def test_invalid_domain(self) -> None:
         """Non-allowed domains should be rejected."""
         assert validate_source_url("https://evil.com/file.parquet") is False
@@ -121,3 +144,21 @@ class TestFilenameGeneration:
         """Raw organizational filenames should follow pattern."""
         assert get_raw_organizational_filename(2020) == "organizational_contributions_2020.parquet"
         assert get_raw_organizational_filename(1980) == "organizational_contributions_1980.parquet"
+
+
+class TestOutputSchemas:
+    """Tests for the output schema factories."""
+
+    def test_schemas_match_column_lists(self) -> None:
+        """Each schema should list the same columns, in order, as its column list."""
+        assert recipient_aggregates_schema().names == list(RECIPIENT_AGGREGATES_COLUMNS)
+        assert recipient_aggregates_with_bioguide_schema().names == list(
+            RECIPIENT_AGGREGATES_WITH_BIOGUIDE_COLUMNS
+        )
+        assert raw_organizational_contributions_schema().names == list(
+            RAW_ORGANIZATIONAL_CONTRIBUTIONS_COLUMNS
+        )
+
+    def test_schema_built_once(self) -> None:
+        """Repeated calls should return the same cached schema object."""
+        assert recipient_aggregates_schema() is recipient_aggregates_schema()
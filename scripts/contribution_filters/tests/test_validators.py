@@ -7,8 +7,16 @@ from pathlib import Path
 import duckdb
 import pytest
 
-from contribution_filters.exceptions import BioguideJoinError
-from contribution_filters.validators import ValidationResult, validate_bioguide_join
+from contribution_filters.exceptions import (
+    AggregationIntegrityError,
+    BioguideJoinError,
+    CompletenessError,
+)
+from contribution_filters.validators import (
+    ValidationResult,
+    validate_bioguide_join,
+    validate_recipient_aggregates,
+)
 
 
 class TestValidationResult:
@@ -25,35 +33,19 @@ class TestValidationResult:
         assert result.aggregation_valid is False
         assert result.aggregation_sample_size == 0
 
-    def test_all_valid_for_filter(self) -> None:
-        """all_valid should be True when row_count and filter are valid."""
-        result = ValidationResult(
-            row_count_valid=True,
-            filter_valid=True,
-        )
-        assert result.all_valid is True
-
-    def test_all_valid_for_aggregation(self) -> None:
-        """all_valid should be True when row_count and aggregation are valid."""
-        result = ValidationResult(
-            row_count_valid=True,
-            aggregation_valid=True,
-        )
-        assert result.all_valid is True
-
-    def test_all_valid_false_when_incomplete(self) -> None:
-        """all_valid should be False when validation incomplete."""
-        # Only row_count valid
-        result = ValidationResult(row_count_valid=True)
-        assert result.all_valid is False
-
-        # Only filter valid
-        result = ValidationResult(filter_valid=True)
-        assert result.all_valid is False
-
-        # Neither valid
-        result = ValidationResult()
-        assert result.all_valid is False
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"row_count_valid": True, "filter_valid": True}, True),
+            ({"row_count_valid": True, "aggregation_valid": True}, True),
+            ({"row_count_valid": True}, False),
+            ({"filter_valid": True}, False),
+            ({}, False),
+        ],
+    )
+    def test_all_valid(self, kwargs: dict[str, bool], expected: bool) -> None:
+        """all_valid needs row_count plus either the filter or aggregation check."""
+        assert ValidationResult(**kwargs).all_valid is expected
 
     def test_bioguide_join_fields_default_values(self) -> None:
         """Bioguide join fields should have proper defaults."""
@@ -80,10 +72,8 @@ class TestValidationResult:
 class TestValidateBioguideJoin:
     """Tests for validate_bioguide_join function."""
 
-    def test_valid_bioguide_ids(self, tmp_path: Path) -> None:
+    def test_valid_bioguide_ids(self, tmp_path: Path, conn: duckdb.DuckDBPyConnection) -> None:
         """Validation should pass when all bioguide_ids exist in legislators."""
-        conn = duckdb.connect()
-
         # Create legislators parquet with some bioguide_ids
         legislators_path = tmp_path / "legislators.parquet"
         conn.execute(f"""
@@ -91,7 +81,8 @@ class TestValidateBioguideJoin:
                 SELECT 'A000001' as bioguide_id UNION ALL
                 SELECT 'B000002' UNION ALL
                 SELECT 'C000003'
-            ) TO '{legislators_path}' (FORMAT PARQUET)
+            ) TO '{legislators_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         # Create output parquet with matching bioguide_ids
@@ -101,7 +92,8 @@ class TestValidateBioguideJoin:
                 SELECT 'A000001' as bioguide_id, 100.0 as amount UNION ALL
                 SELECT 'B000002', 200.0 UNION ALL
                 SELECT NULL, 300.0  -- NULL should be ignored
-            ) TO '{output_path}' (FORMAT PARQUET)
+            ) TO '{output_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         result = validate_bioguide_join(output_path, legislators_path, conn)
@@ -110,18 +102,18 @@ class TestValidateBioguideJoin:
         assert result.bioguide_matched_count == 2
         assert result.output_count == 3
         assert result.bioguide_coverage_pct == pytest.approx(66.67, rel=0.01)
-        conn.close()
 
-    def test_invalid_bioguide_ids_raises_error(self, tmp_path: Path) -> None:
+    def test_invalid_bioguide_ids_raises_error(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """Validation should fail when bioguide_ids don't exist in legislators."""
-        conn = duckdb.connect()
-
         # Create legislators parquet with limited bioguide_ids
         legislators_path = tmp_path / "legislators.parquet"
         conn.execute(f"""
             COPY (
                 SELECT 'A000001' as bioguide_id
-            ) TO '{legislators_path}' (FORMAT PARQUET)
+            ) TO '{legislators_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         # Create output parquet with bioguide_ids NOT in legislators
@@ -131,7 +123,8 @@ class TestValidateBioguideJoin:
                 SELECT 'A000001' as bioguide_id, 100.0 as amount UNION ALL
                 SELECT 'X000099', 200.0 UNION ALL
                 SELECT 'Y000098', 300.0
-            ) TO '{output_path}' (FORMAT PARQUET)
+            ) TO '{output_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         with pytest.raises(BioguideJoinError) as exc_info:
@@ -140,18 +133,16 @@ class TestValidateBioguideJoin:
         assert exc_info.value.total_invalid == 2
         assert "X000099" in exc_info.value.invalid_bioguide_ids
         assert "Y000098" in exc_info.value.invalid_bioguide_ids
-        conn.close()
 
-    def test_all_null_bioguide_ids(self, tmp_path: Path) -> None:
+    def test_all_null_bioguide_ids(self, tmp_path: Path, conn: duckdb.DuckDBPyConnection) -> None:
         """Validation should pass when all bioguide_ids are NULL."""
-        conn = duckdb.connect()
-
         # Create legislators parquet
         legislators_path = tmp_path / "legislators.parquet"
         conn.execute(f"""
             COPY (
                 SELECT 'A000001' as bioguide_id
-            ) TO '{legislators_path}' (FORMAT PARQUET)
+            ) TO '{legislators_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         # Create output parquet with all NULL bioguide_ids
@@ -160,7 +151,8 @@ class TestValidateBioguideJoin:
             COPY (
                 SELECT NULL::VARCHAR as bioguide_id, 100.0 as amount UNION ALL
                 SELECT NULL, 200.0
-            ) TO '{output_path}' (FORMAT PARQUET)
+            ) TO '{output_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         result = validate_bioguide_join(output_path, legislators_path, conn)
@@ -169,19 +161,17 @@ class TestValidateBioguideJoin:
         assert result.bioguide_matched_count == 0
         assert result.output_count == 2
         assert result.bioguide_coverage_pct == 0.0
-        conn.close()
 
-    def test_coverage_calculation(self, tmp_path: Path) -> None:
+    def test_coverage_calculation(self, tmp_path: Path, conn: duckdb.DuckDBPyConnection) -> None:
         """Coverage percentage should be calculated correctly."""
-        conn = duckdb.connect()
-
         # Create legislators parquet
         legislators_path = tmp_path / "legislators.parquet"
         conn.execute(f"""
             COPY (
                 SELECT 'A000001' as bioguide_id UNION ALL
                 SELECT 'B000002'
-            ) TO '{legislators_path}' (FORMAT PARQUET)
+            ) TO '{legislators_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         # Create output with 1 match out of 10 rows
@@ -198,7 +188,8 @@ class TestValidateBioguideJoin:
                 SELECT NULL, 100.0 UNION ALL
                 SELECT NULL, 100.0 UNION ALL
                 SELECT NULL, 100.0
-            ) TO '{output_path}' (FORMAT PARQUET)
+            ) TO '{output_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
         """)
 
         result = validate_bioguide_join(output_path, legislators_path, conn)
@@ -207,4 +198,142 @@ class TestValidateBioguideJoin:
         assert result.bioguide_matched_count == 1
         assert result.output_count == 10
         assert result.bioguide_coverage_pct == pytest.approx(10.0, rel=0.01)
-        conn.close()
+
+    def test_coverage_summed_across_row_groups(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """Coverage read from footer statistics should add up every row group."""
+        legislators_path = tmp_path / "legislators.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'A000001' as bioguide_id
+            ) TO '{legislators_path}'
+            (FORMAT PARQUET, COMPRESSION 'UNCOMPRESSED', ROW_GROUP_SIZE 1024)
+        """)
+
+        # One in three of 5,000 rows matched, spread over several row groups
+        output_path = tmp_path / "output.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT CASE WHEN i % 3 = 0 THEN 'A000001' END as bioguide_id
+                FROM range(5000) t(i)
+            ) TO '{output_path}' (FORMAT PARQUET, ROW_GROUP_SIZE 1024)
+        """)
+        row_groups = conn.execute(f"""
+            SELECT COUNT(DISTINCT row_group_id) FROM parquet_metadata('{output_path}')
+        """).fetchone()[0]
+        assert row_groups > 1
+
+        result = validate_bioguide_join(output_path, legislators_path, conn)
+
+        assert result.bioguide_matched_count == 1667
+        assert result.output_count == 5000
+
+
+class TestValidateRecipientAggregates:
+    """Tests for validate_recipient_aggregates function."""
+
+    @pytest.fixture
+    def source_path(self, tmp_path: Path, conn: duckdb.DuckDBPyConnection) -> Path:
+        """Create a source contributions parquet file."""
+        source_path = tmp_path / "source.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 100.0::DOUBLE as amount UNION ALL
+                SELECT 'rid001', 50.0 UNION ALL
+                SELECT 'rid002', 25.0
+            ) TO '{source_path}' (FORMAT PARQUET)
+        """)
+        return source_path
+
+    def test_matching_aggregates(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection, source_path: Path
+    ) -> None:
+        """Validation should pass when every sampled total matches the source."""
+        output_path = tmp_path / "output.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 150.0::DOUBLE as total_amount,
+                       2::BIGINT as contribution_count UNION ALL
+                SELECT 'rid002', 25.0, 1
+            ) TO '{output_path}' (FORMAT PARQUET)
+        """)
+
+        result = validate_recipient_aggregates(str(source_path), output_path, conn)
+
+        assert result.aggregation_valid is True
+        assert result.aggregation_sample_size == 2
+
+    def test_count_mismatch_raises_error(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection, source_path: Path
+    ) -> None:
+        """A wrong contribution_count should raise AggregationIntegrityError."""
+        output_path = tmp_path / "output.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 150.0::DOUBLE as total_amount,
+                       3::BIGINT as contribution_count UNION ALL
+                SELECT 'rid002', 25.0, 1
+            ) TO '{output_path}' (FORMAT PARQUET)
+        """)
+
+        with pytest.raises(AggregationIntegrityError) as exc_info:
+            validate_recipient_aggregates(str(source_path), output_path, conn)
+
+        assert exc_info.value.recipient_id == "rid001"
+        assert exc_info.value.field_name == "contribution_count"
+
+    def test_sample_size_caps_checked_recipients(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection, source_path: Path
+    ) -> None:
+        """Only sample_size recipients should be checked when the output has more."""
+        output_path = tmp_path / "output.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 150.0::DOUBLE as total_amount,
+                       2::BIGINT as contribution_count UNION ALL
+                SELECT 'rid002', 25.0, 1
+            ) TO '{output_path}' (FORMAT PARQUET)
+        """)
+
+        result = validate_recipient_aggregates(
+            str(source_path), output_path, conn, sample_size=1, output_count=2
+        )
+
+        assert result.aggregation_sample_size == 1
+        assert result.output_count == 2
+
+    def test_seeded_sample(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection, source_path: Path
+    ) -> None:
+        """A seeded sample should pass validation with the requested size."""
+        output_path = tmp_path / "output.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT 'rid001' as "bonica.rid", 150.0::DOUBLE as total_amount,
+                       2::BIGINT as contribution_count UNION ALL
+                SELECT 'rid002', 25.0, 1
+            ) TO '{output_path}' (FORMAT PARQUET)
+        """)
+
+        result = validate_recipient_aggregates(
+            str(source_path), output_path, conn, sample_size=1, seed=42
+        )
+
+        assert result.aggregation_valid is True
+        assert result.aggregation_sample_size == 1
+
+    def test_empty_output_raises_error(
+        self, tmp_path: Path, conn: duckdb.DuckDBPyConnection, source_path: Path
+    ) -> None:
+        """An output without recipients should raise CompletenessError."""
+        output_path = tmp_path / "output.parquet"
+        conn.execute(f"""
+            COPY (
+                SELECT NULL::VARCHAR as "bonica.rid", 0.0::DOUBLE as total_amount,
+                       0::BIGINT as contribution_count
+            ) TO '{output_path}' (FORMAT PARQUET)
+        """)
+
+        with pytest.raises(CompletenessError):
+            validate_recipient_aggregates(str(source_path), output_path, conn)
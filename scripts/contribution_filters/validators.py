@@ -7,7 +7,6 @@ Validates:
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,7 +20,7 @@ from .exceptions import (
     CompletenessError,
     FilterValidationError,
 )
-from .schema import escape_sql_string
+from .schema import parquet_scan
 
 
 @dataclass
@@ -49,6 +48,13 @@ class ValidationResult:
         return self.row_count_valid and (self.filter_valid or self.aggregation_valid)
 
 
+def _parquet_row_count(path: Path, conn: duckdb.DuckDBPyConnection) -> int:
+    """Return the row count recorded in a parquet file's footer."""
+    return conn.execute(
+        "SELECT num_rows FROM parquet_file_metadata($path)", {"path": str(path)}
+    ).fetchone()[0]
+
+
 def validate_organizational_output(
     source_url: str,
     output_path: Path,
@@ -81,10 +87,10 @@ def validate_organizational_output(
     result.row_count_valid = True
 
     # Tier 2: Verify no individuals in output
-    # Detect which column naming convention is used
-    columns = conn.execute(f"""
-        SELECT column_name FROM (DESCRIBE SELECT * FROM read_parquet('{output_path}'))
-    """).fetchall()
+    # Detect which column naming convention is used (footer schema only)
+    columns = conn.execute(
+        "SELECT name FROM parquet_schema($output_path)", {"output_path": str(output_path)}
+    ).fetchall()
     column_names = {c[0] for c in columns}
 
     if "contributor_type" in column_names:
@@ -97,11 +103,14 @@ def validate_organizational_output(
         result.filter_checks_passed = 0
         return result
 
-    individual_count = conn.execute(f"""
+    individual_count = conn.execute(
+        f"""
         SELECT COUNT(*)
-        FROM read_parquet('{output_path}')
+        FROM read_parquet($output_path)
         WHERE {contributor_type_col} = 'I'
-    """).fetchone()[0]
+        """,
+        {"output_path": str(output_path)},
+    ).fetchone()[0]
 
     if individual_count > 0:
         raise FilterValidationError(
@@ -121,27 +130,40 @@ def validate_recipient_aggregates(
     output_path: Path,
     conn: duckdb.DuckDBPyConnection,
     sample_size: int = 100,
+    *,
+    source: str | None = None,
+    source_distinct: int | None = None,
+    output_count: int | None = None,
+    seed: int | None = None,
 ) -> ValidationResult:
     """
     Validate recipient aggregates output.
 
     Checks:
     - Completeness: All distinct recipient IDs appear in output
-    - Aggregation: SUM/COUNT matches for sampled recipients
+    - Aggregation: SUM/COUNT matches for sampled recipients (one joined query)
+
+    If source is given (e.g. a staged temp table), source rows are read from it
+    instead of scanning source_url again. If source_distinct or output_count are
+    given (already known from reading the source or writing the output), they
+    are reused instead of being counted again. If seed is given, the same
+    recipients are sampled on every run.
     """
     result = ValidationResult()
+    source = source or parquet_scan(source_url)
+    repeatable = f" REPEATABLE ({int(seed)})" if seed is not None else ""
 
     # Tier 1: Completeness - distinct recipient count matches
-    source_distinct = conn.execute(f"""
-        SELECT COUNT(DISTINCT "bonica.rid")
-        FROM read_parquet('{source_url}')
-        WHERE "bonica.rid" IS NOT NULL
-    """).fetchone()[0]
+    if source_distinct is None:
+        source_distinct = conn.execute(f"""
+            SELECT COUNT(DISTINCT "bonica.rid")
+            FROM {source}
+            WHERE "bonica.rid" IS NOT NULL
+        """).fetchone()[0]
     result.source_rows = source_distinct
 
-    output_count = conn.execute(f"""
-        SELECT COUNT(*) FROM read_parquet('{output_path}')
-    """).fetchone()[0]
+    if output_count is None:
+        output_count = _parquet_row_count(output_path, conn)
     result.output_count = output_count
 
     # Note: output_count may differ from source_distinct due to GROUP BY
@@ -150,48 +172,61 @@ def validate_recipient_aggregates(
     result.row_count_valid = True
 
     # Tier 2: Sample aggregation verification
-    all_rids = conn.execute(f"""
-        SELECT DISTINCT "bonica.rid" FROM read_parquet('{output_path}')
-    """).fetchall()
-    all_rids = [r[0] for r in all_rids if r[0] is not None]
-
-    if not all_rids:
+    # Sample recipients inside DuckDB (no list of every recipient ID in Python),
+    # then aggregate source and output for the whole sample in one pass each,
+    # rather than two filtered scans per recipient. MATERIALIZED keeps the
+    # sample fixed across its three references.
+    comparisons = conn.execute(
+        f"""
+        WITH sample AS MATERIALIZED (
+            SELECT rid
+            FROM (
+                SELECT DISTINCT "bonica.rid" AS rid
+                FROM read_parquet($output_path)
+                WHERE "bonica.rid" IS NOT NULL
+            )
+            USING SAMPLE reservoir({int(sample_size)} ROWS){repeatable}
+        ),
+        expected AS (
+            SELECT
+                "bonica.rid" AS rid,
+                SUM(amount) AS expected_total,
+                COUNT(*) AS expected_count
+            FROM {source}
+            WHERE "bonica.rid" IN (SELECT rid FROM sample)
+            GROUP BY "bonica.rid"
+        ),
+        actual AS (
+            SELECT
+                "bonica.rid" AS rid,
+                SUM(total_amount) AS actual_total,
+                SUM(contribution_count) AS actual_count
+            FROM read_parquet($output_path)
+            WHERE "bonica.rid" IN (SELECT rid FROM sample)
+            GROUP BY "bonica.rid"
+        )
+        SELECT
+            sample.rid,
+            e.expected_total,
+            COALESCE(e.expected_count, 0),
+            a.actual_total,
+            a.actual_count
+        FROM sample
+        LEFT JOIN expected e ON sample.rid = e.rid
+        LEFT JOIN actual a ON sample.rid = a.rid
+        """,
+        {"output_path": str(output_path)},
+    ).fetchall()
+
+    if not comparisons:
         raise CompletenessError(
             message="No recipients found in output",
             expected_count=source_distinct,
             actual_count=0,
         )
+    result.aggregation_sample_size = len(comparisons)
 
-    actual_sample_size = min(sample_size, len(all_rids))
-    sample_rids = random.sample(all_rids, actual_sample_size)
-    result.aggregation_sample_size = actual_sample_size
-
-    for rid in sample_rids:
-        # Escape recipient ID for safe SQL interpolation
-        rid_escaped = escape_sql_string(rid)
-
-        # Get expected values from source
-        expected = conn.execute(f"""
-            SELECT
-                SUM(amount) as expected_total,
-                COUNT(*) as expected_count
-            FROM read_parquet('{source_url}')
-            WHERE "bonica.rid" = '{rid_escaped}'
-        """).fetchone()
-
-        expected_total, expected_count = expected
-
-        # Get actual values from output (sum across all rows for this rid)
-        actual = conn.execute(f"""
-            SELECT
-                SUM(total_amount) as actual_total,
-                SUM(contribution_count) as actual_count
-            FROM read_parquet('{output_path}')
-            WHERE "bonica.rid" = '{rid_escaped}'
-        """).fetchone()
-
-        actual_total, actual_count = actual
-
+    for rid, expected_total, expected_count, actual_total, actual_count in comparisons:
         # Verify count
         if actual_count != expected_count:
             raise AggregationIntegrityError(
@@ -247,41 +282,50 @@ def validate_bioguide_join(
     """
     result = ValidationResult()
 
-    # Get all distinct bioguide_ids from output
-    output_bioguides = conn.execute(f"""
-        SELECT DISTINCT bioguide_id
-        FROM read_parquet('{output_path}')
-        WHERE bioguide_id IS NOT NULL
-    """).fetchall()
-    output_bioguide_set = {r[0] for r in output_bioguides if r[0]}
-
-    # Get all bioguide_ids from legislators
-    legislators_bioguides = conn.execute(f"""
-        SELECT DISTINCT bioguide_id
-        FROM read_parquet('{legislators_path}')
-        WHERE bioguide_id IS NOT NULL
-    """).fetchall()
-    legislators_bioguide_set = {r[0] for r in legislators_bioguides if r[0]}
-
-    # Check for invalid bioguide_ids (in output but not in legislators)
-    invalid_bioguides = output_bioguide_set - legislators_bioguide_set
-
-    if invalid_bioguides:
+    # Find bioguide_ids in output that don't exist in legislators. The anti-join
+    # runs in DuckDB, so only the count and a few examples come back to Python.
+    total_invalid, invalid_examples = conn.execute(
+        """
+        WITH invalid AS (
+            SELECT DISTINCT o.bioguide_id
+            FROM read_parquet($output_path) o
+            ANTI JOIN read_parquet($legislators_path) l ON o.bioguide_id = l.bioguide_id
+            WHERE o.bioguide_id IS NOT NULL AND o.bioguide_id != ''
+        )
+        SELECT COUNT(*), list(bioguide_id ORDER BY bioguide_id)[1:10]
+        FROM invalid
+        """,
+        {"output_path": str(output_path), "legislators_path": str(legislators_path)},
+    ).fetchone()
+
+    if total_invalid:
         raise BioguideJoinError(
             message="Found bioguide_ids in output that don't exist in legislators",
-            invalid_bioguide_ids=sorted(invalid_bioguides)[:10],
-            total_invalid=len(invalid_bioguides),
+            invalid_bioguide_ids=invalid_examples,
+            total_invalid=total_invalid,
         )
 
-    # Calculate coverage statistics
-    total_output_rows = conn.execute(f"""
-        SELECT COUNT(*) FROM read_parquet('{output_path}')
-    """).fetchone()[0]
-
-    matched_rows = conn.execute(f"""
-        SELECT COUNT(*) FROM read_parquet('{output_path}')
-        WHERE bioguide_id IS NOT NULL
-    """).fetchone()[0]
+    # Calculate coverage statistics from the parquet footer: row counts and
+    # bioguide_id null counts per row group. Only scan the column if a row
+    # group was written without null-count statistics.
+    total_output_rows, null_rows, has_stats = conn.execute(
+        """
+        SELECT
+            COALESCE(SUM(row_group_num_rows), 0),
+            SUM(stats_null_count),
+            COUNT(stats_null_count) = COUNT(*)
+        FROM parquet_metadata($output_path)
+        WHERE path_in_schema = 'bioguide_id'
+        """,
+        {"output_path": str(output_path)},
+    ).fetchone()
+    if has_stats:
+        matched_rows = total_output_rows - (null_rows or 0)
+    else:
+        total_output_rows, matched_rows = conn.execute(
+            "SELECT COUNT(*), COUNT(bioguide_id) FROM read_parquet($output_path)",
+            {"output_path": str(output_path)},
+        ).fetchone()
 
     result.row_count_valid = True
     result.output_count = total_output_rows
@@ -1,7 +1,5 @@
 """Core DIME CSV to Parquet conversion logic."""
 
-import csv
-import gzip
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -12,6 +10,7 @@ import pyarrow.parquet as pq
 
 from .exceptions import CSVParseError, SchemaValidationError
 from .schema import (
+    INPUT_BUFFER_SIZE,
     NULL_VALUES,
     FileType,
     FileTypeConfig,
@@ -84,9 +83,9 @@ def convert_dime_file(
     # Get configuration for this file type
     config = get_config(file_type)
 
-    # Step 1: Pre-flight row count (fast, using csv module)
+    # Step 1: Pre-flight row count (separate streaming pass, PyArrow parser)
     print(f"  Counting rows in {source_path.name}...")
-    expected_row_count = _count_csv_rows(source_path)
+    expected_row_count = _count_csv_rows(source_path, config)
     print(f"  Found {expected_row_count:,} rows")
 
     # Step 2: Stream CSV to Parquet (memory-efficient)
@@ -103,31 +102,40 @@ def convert_dime_file(
     if validate:
         print("  Validating...")
 
-        # Validation tier 1: Row count (fastest - uses parquet metadata)
-        validation_result = validate_row_count(source_path, output_path, expected_row_count)
-        print(f"    Row count: PASS ({validation_result.row_count_actual:,})")
-
-        # Validation tier 2: Column checksums (uses streaming stats + column reads)
-        validation_result = validate_checksums(
-            source_path,
-            output_path,
-            stats,
-            validation_result,
-            sum_column=config.sum_column,
-            key_columns=config.key_columns,
-        )
-        if config.sum_column:
-            print(
-                f"    Checksums: PASS ({config.sum_column} sum: {validation_result.sum_column_actual:,.2f})"
+        # Open the output once; every tier reuses its parsed footer
+        with pq.ParquetFile(output_path) as parquet_file:
+            # Validation tier 1: Row count (fastest - uses parquet metadata)
+            validation_result = validate_row_count(
+                source_path, output_path, expected_row_count, parquet_file=parquet_file
             )
-        else:
-            print("    Checksums: PASS (non-null counts verified)")
-
-        # Validation tier 3: Sample comparison
-        validation_result = validate_sample_rows(
-            source_path, output_path, sample_size, validation_result
-        )
-        print(f"    Sample comparison: PASS ({validation_result.sample_size} rows)")
+            print(f"    Row count: PASS ({validation_result.row_count_actual:,})")
+
+            # Validation tier 2: Column checksums (uses streaming stats + column reads)
+            validation_result = validate_checksums(
+                source_path,
+                output_path,
+                stats,
+                validation_result,
+                sum_column=config.sum_column,
+                key_columns=config.key_columns,
+                parquet_file=parquet_file,
+            )
+            if config.sum_column:
+                print(
+                    f"    Checksums: PASS ({config.sum_column} sum: {validation_result.sum_column_actual:,.2f})"
+                )
+            else:
+                print("    Checksums: PASS (non-null counts verified)")
+
+            # Validation tier 3: Sample comparison
+            validation_result = validate_sample_rows(
+                source_path,
+                output_path,
+                sample_size,
+                validation_result,
+                parquet_file=parquet_file,
+            )
+            print(f"    Sample comparison: PASS ({validation_result.sample_size} rows)")
 
     return ConversionResult(
         source_path=source_path,
@@ -137,23 +145,41 @@ def convert_dime_file(
     )
 
 
-def _count_csv_rows(path: Path) -> int:
+def _count_csv_rows(path: Path, config: FileTypeConfig) -> int:
     """
-    Count data rows in CSV using Python csv module.
+    Count data rows in CSV using PyArrow's streaming reader.
 
     This handles multi-line records (embedded newlines in quoted fields)
-    correctly, unlike simple newline counting.
+    correctly, unlike simple newline counting. Only the first key column
+    is converted, so the count runs in Arrow's C++ parser rather than a
+    Python loop over every row.
     """
-    count = 0
-    with gzip.open(path, "rt", encoding="latin1") as f:
-        reader = csv.reader(f, doublequote=True)
-        # Skip header
-        next(reader)
-        # Count data rows with progress
-        for _ in reader:
-            count += 1
-            if count % 10_000_000 == 0:
-                print(f"    Counted {count:,} rows...", flush=True)
+    count_column = config.key_columns[0]
+    try:
+        with pa.input_stream(path, buffer_size=INPUT_BUFFER_SIZE) as source:
+            reader = pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(encoding="latin1"),
+                parse_options=pa_csv.ParseOptions(double_quote=True, newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=[count_column],
+                    # A file without the column is still counted; the schema
+                    # check after conversion reports the mismatch
+                    include_missing_columns=True,
+                    column_types={count_column: pa.string()},
+                ),
+            )
+            count = 0
+            for batch in reader:
+                previous = count
+                count += batch.num_rows
+                if count // 10_000_000 > previous // 10_000_000:
+                    print(f"    Counted {count:,} rows...", flush=True)
+    except pa.ArrowInvalid as e:
+        raise CSVParseError(
+            source_path=path,
+            message=f"PyArrow CSV parse error while counting rows: {e}",
+        ) from e
     return count
 
 
@@ -203,11 +229,14 @@ def _stream_csv_to_parquet(
         stats.non_null_counts[col] = 0
 
     writer: pq.ParquetWriter | None = None
+    source: pa.NativeFile | None = None
 
     try:
-        # Open CSV as streaming reader
+        # Open CSV as streaming reader over a buffered input stream
+        # (gzip is detected from the file extension and decompressed in the stream)
+        source = pa.input_stream(source_path, buffer_size=INPUT_BUFFER_SIZE)
         reader = pa_csv.open_csv(
-            source_path,
+            source,
             read_options=read_options,
             parse_options=parse_options,
             convert_options=convert_options,
@@ -229,8 +258,7 @@ def _stream_csv_to_parquet(
                 )
 
             # Write batch to parquet
-            table = pa.Table.from_batches([batch])
-            writer.write_table(table)
+            writer.write_batch(batch)
 
             # Accumulate stats
             stats.row_count += batch.num_rows
@@ -242,12 +270,10 @@ def _stream_csv_to_parquet(
                 if batch_sum is not None:
                     stats.sum_column_value += batch_sum
 
-            # Non-null counts for key columns
+            # Non-null counts for key columns (null_count is a field read, no kernel)
             for col in config.key_columns:
                 if col in batch.schema.names:
-                    col_data = batch.column(col)
-                    count = pc.count(col_data).as_py()
-                    stats.non_null_counts[col] += count
+                    stats.non_null_counts[col] += batch.num_rows - batch.column(col).null_count
 
             # Progress indicator for large files
             if batch_num % 10 == 0:
@@ -265,6 +291,8 @@ def _stream_csv_to_parquet(
     finally:
         if writer is not None:
             writer.close()
+        if source is not None:
+            source.close()
 
     return stats
 
@@ -233,3 +233,7 @@ def get_config(file_type: FileType) -> FileTypeConfig:
 
 # MySQL export null marker and empty string
 NULL_VALUES = ["\\N", ""]
+
+# Read-ahead buffer on the compressed CSV input, so gzip inflates from large
+# buffered reads instead of many small ones
+INPUT_BUFFER_SIZE = 4 << 20  # 4 MiB
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import csv
-import gzip
+import bisect
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pyarrow as pa
 import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
 
 from .exceptions import (
@@ -17,6 +18,7 @@ from .exceptions import (
     RowCountMismatchError,
     SampleMismatchError,
 )
+from .schema import INPUT_BUFFER_SIZE
 
 if TYPE_CHECKING:
     from .converter import StreamingStats
@@ -48,14 +50,17 @@ def validate_row_count(
     source_path: Path,
     output_path: Path,
     expected_count: int,
+    *,
+    parquet_file: pq.ParquetFile | None = None,
 ) -> ValidationResult:
     """
     Tier 1 validation: Verify row counts match.
 
-    This is the fastest validation - just reads parquet metadata.
+    This is the fastest validation - just reads parquet metadata. If
+    parquet_file is given, its already-parsed footer is used.
     """
-    meta = pq.read_metadata(output_path)
-    actual_count = meta.num_rows
+    parquet_file = parquet_file or pq.ParquetFile(output_path)
+    actual_count = parquet_file.metadata.num_rows
 
     result = ValidationResult(
         row_count_expected=expected_count,
@@ -81,12 +86,15 @@ def validate_checksums(
     result: ValidationResult,
     sum_column: str | None = "amount",
     key_columns: list[str] | None = None,
+    *,
+    parquet_file: pq.ParquetFile | None = None,
 ) -> ValidationResult:
     """
     Tier 2 validation: Verify column checksums.
 
-    Compares streaming stats (accumulated during conversion) against
-    parquet data using memory-efficient column-level reads.
+    Compares streaming stats (accumulated during conversion) against the
+    parquet file: non-null counts from footer statistics where present, and
+    the sum from a single streaming pass over the needed columns.
 
     Compares:
     - Sum of configurable column (detects truncation/conversion errors)
@@ -99,20 +107,40 @@ def validate_checksums(
         result: ValidationResult to update
         sum_column: Column to sum for checksum (None to skip sum validation)
         key_columns: Columns to check non-null counts
+        parquet_file: Already-open output file to reuse (opened if None)
     """
     if key_columns is None:
         key_columns = ["transaction.id", "bonica.cid", "contributor.name", "amount"]
 
     result.sum_column_name = sum_column
 
+    # Non-null counts come from the footer's per-row-group null counts where
+    # the writer recorded them. The sum column, and any key column without
+    # statistics, is read in one streaming pass, so each column is decoded at
+    # most once and only one batch is held in memory at a time.
+    parquet_file = parquet_file or pq.ParquetFile(output_path)
+    parquet_counts: dict[str, int] = {}
+    for col in key_columns:
+        count = _footer_non_null_count(parquet_file.metadata, col)
+        if count is not None:
+            parquet_counts[col] = count
+    scan_counts = [col for col in key_columns if col not in parquet_counts]
+    columns = list(dict.fromkeys([*([sum_column] if sum_column else []), *scan_counts]))
+
+    parquet_sum = 0.0
+    parquet_counts.update(dict.fromkeys(scan_counts, 0))
+    if columns:
+        for batch in parquet_file.iter_batches(columns=columns):
+            if sum_column:
+                parquet_sum += pc.sum(batch.column(sum_column)).as_py() or 0.0
+            for col in scan_counts:
+                col_data = batch.column(col)
+                parquet_counts[col] += len(col_data) - col_data.null_count
+
     # Checksum 1: Sum of configurable column
     if sum_column:
         source_sum = source_stats.sum_column_value
 
-        # Read only the sum column from parquet (memory-efficient)
-        sum_table = pq.read_table(output_path, columns=[sum_column])
-        parquet_sum = pc.sum(sum_table.column(sum_column)).as_py() or 0.0
-
         result.sum_column_expected = source_sum
         result.sum_column_actual = parquet_sum
 
@@ -126,13 +154,10 @@ def validate_checksums(
                 actual_value=parquet_sum,
             )
 
-    # Checksum 2: Non-null counts for key columns (column-level reads)
+    # Checksum 2: Non-null counts for key columns
     for col in key_columns:
         source_count = source_stats.non_null_counts.get(col, 0)
-
-        # Read only this column from parquet
-        col_table = pq.read_table(output_path, columns=[col])
-        parquet_count = pc.count(col_table.column(col)).as_py()
+        parquet_count = parquet_counts[col]
 
         result.non_null_counts[col] = (source_count, parquet_count)
 
@@ -149,55 +174,83 @@ def validate_checksums(
     return result
 
 
+def _footer_non_null_count(metadata: pq.FileMetaData, column: str) -> int | None:
+    """
+    Count non-null values of a column from parquet footer statistics.
+
+    Returns None if the column is missing or any row group lacks a null count,
+    in which case the column has to be read instead.
+    """
+    names = metadata.schema.names
+    if column not in names:
+        return None
+    col_idx = names.index(column)
+    non_null = 0
+    for rg in range(metadata.num_row_groups):
+        chunk = metadata.row_group(rg).column(col_idx)
+        stats = chunk.statistics
+        if stats is None or not stats.has_null_count:
+            return None
+        non_null += chunk.num_values - stats.null_count
+    return non_null
+
+
 def validate_sample_rows(
     source_path: Path,
     output_path: Path,
     sample_size: int,
     result: ValidationResult,
+    *,
+    parquet_file: pq.ParquetFile | None = None,
 ) -> ValidationResult:
     """
     Tier 3 validation: Compare random sample of rows.
 
     Uses memory-efficient batch reading: iterates through parquet in batches,
     capturing sample rows as encountered rather than loading entire file.
+    If parquet_file is given, its already-parsed footer is reused.
     """
+    parquet_file = parquet_file or pq.ParquetFile(output_path)
+
     # Get total row count from parquet metadata
-    meta = pq.read_metadata(output_path)
-    total_rows = meta.num_rows
+    total_rows = parquet_file.metadata.num_rows
 
     # Select random row indices
     actual_sample_size = min(sample_size, total_rows)
     sample_indices = sorted(random.sample(range(total_rows), actual_sample_size))
 
-    # Read source CSV rows at sample indices
-    source_rows = _read_csv_rows_at_indices(source_path, sample_indices)
-
     # Read parquet in batches, capturing sample rows (memory-efficient)
-    parquet_file = pq.ParquetFile(output_path)
     schema_names = parquet_file.schema_arrow.names
 
+    # Read source CSV rows at sample indices
+    source_rows = _read_csv_rows_at_indices(source_path, sample_indices, schema_names)
+
     # Map from sample index to its position in our results
     index_to_position = {idx: pos for pos, idx in enumerate(sample_indices)}
     parquet_sample_rows: list[dict | None] = [None] * len(sample_indices)
+    remaining = len(sample_indices)
 
     current_row = 0
     for batch in parquet_file.iter_batches():
         batch_end = current_row + batch.num_rows
 
-        # Check if any sample indices fall in this batch
-        for sample_idx in sample_indices:
-            if current_row <= sample_idx < batch_end:
-                # Extract this row from the batch
-                local_idx = sample_idx - current_row
-                row_dict = {}
-                for col_name in schema_names:
-                    row_dict[col_name] = batch.column(col_name)[local_idx].as_py()
+        # Sample indices in this batch (sample_indices is sorted)
+        lo = bisect.bisect_left(sample_indices, current_row)
+        hi = bisect.bisect_left(sample_indices, batch_end, lo)
+        in_batch = sample_indices[lo:hi]
+        if in_batch:
+            # Gather this batch's sample rows with one take and convert them to
+            # Python together, rather than boxing each cell as an Arrow scalar
+            local_indices = pa.array([idx - current_row for idx in in_batch])
+            sampled = batch.take(local_indices).to_pylist()
+            for sample_idx, row_dict in zip(in_batch, sampled, strict=True):
                 parquet_sample_rows[index_to_position[sample_idx]] = row_dict
+            remaining -= len(in_batch)
 
         current_row = batch_end
 
         # Early exit if we have all samples
-        if all(r is not None for r in parquet_sample_rows):
+        if remaining == 0:
             break
 
     # Compare
@@ -228,22 +281,55 @@ def validate_sample_rows(
     return result
 
 
-def _read_csv_rows_at_indices(path: Path, indices: list[int]) -> list[dict]:
-    """Read specific rows from CSV by index."""
-    rows = []
-    indices_set = set(indices)
-    index_to_position = {idx: pos for pos, idx in enumerate(sorted(indices))}
+def _read_csv_rows_at_indices(
+    path: Path, indices: list[int], column_names: list[str]
+) -> list[dict]:
+    """
+    Read specific rows from CSV by index.
+
+    Uses PyArrow's streaming CSV reader with every column read as raw text,
+    so tokenizing runs in C++; each batch's sampled rows are located with
+    bisect and taken together, and only those rows become Python dicts.
+    Type conversion is left to the comparison, which checks it against the
+    typed parquet values.
+    """
+    sorted_indices = sorted(indices)
+    index_to_position = {idx: pos for pos, idx in enumerate(sorted_indices)}
 
     # Pre-allocate result list
-    rows = [None] * len(indices)
-
-    with gzip.open(path, "rt", encoding="latin1") as f:
-        reader = csv.DictReader(f, doublequote=True)
-        for i, row in enumerate(reader):
-            if i in indices_set:
-                rows[index_to_position[i]] = row
-                if all(r is not None for r in rows):
-                    break
+    rows: list[dict | None] = [None] * len(indices)
+    remaining = len(sorted_indices)
+
+    if not remaining:
+        return rows
+
+    with pa.input_stream(path, buffer_size=INPUT_BUFFER_SIZE) as source:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(encoding="latin1"),
+            parse_options=pa_csv.ParseOptions(double_quote=True, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(column_names, pa.string()),
+            ),
+        )
+        current_row = 0
+        for batch in reader:
+            batch_end = current_row + batch.num_rows
+
+            # Sample indices in this batch, gathered with one take
+            lo = bisect.bisect_left(sorted_indices, current_row)
+            hi = bisect.bisect_left(sorted_indices, batch_end, lo)
+            in_batch = sorted_indices[lo:hi]
+            if in_batch:
+                local_indices = pa.array([idx - current_row for idx in in_batch])
+                sampled = batch.take(local_indices).to_pylist()
+                for idx, row_dict in zip(in_batch, sampled, strict=True):
+                    rows[index_to_position[idx]] = row_dict
+                remaining -= len(in_batch)
+
+            if remaining == 0:
+                break
+            current_row = batch_end
 
     return rows
 
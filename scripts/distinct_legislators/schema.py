@@ -1,5 +1,7 @@
 """Schema definitions for distinct legislators output."""
 
+from urllib.parse import urlparse
+
 import pyarrow as pa
 
 # =============================================================================
@@ -11,9 +13,7 @@ HF_BASE_URL = "https://huggingface.co/datasets/Dustinhax/tyt/resolve/main"
 VOTEVIEW_MEMBERS_URL = f"{HF_BASE_URL}/voteview/HSall_members.parquet"
 
 # Allowed domains for source URLs (SQL injection mitigation)
-ALLOWED_SOURCE_DOMAINS = [
-    "huggingface.co",
-]
+ALLOWED_SOURCE_DOMAINS = ("huggingface.co",)
 
 
 def validate_source_url(url: str) -> bool:
@@ -25,10 +25,8 @@ def validate_source_url(url: str) -> bool:
     Returns:
         True if URL is from an allowed domain
     """
-    from urllib.parse import urlparse
-
     parsed = urlparse(url)
-    return any(parsed.netloc.endswith(domain) for domain in ALLOWED_SOURCE_DOMAINS)
+    return parsed.netloc.endswith(ALLOWED_SOURCE_DOMAINS)
 
 
 # Congress filter: 96th congress (1979-1980) and later
@@ -71,7 +71,7 @@ def extract_crosswalk(
         raise InvalidSourceURLError(
             message="Source URL must be from an allowed domain",
             source_url=source_url,
-            allowed_domains=ALLOWED_SOURCE_DOMAINS,
+            allowed_domains=list(ALLOWED_SOURCE_DOMAINS),
         )
 
     with duckdb.connect() as conn:
@@ -1,6 +1,7 @@
 """Schema definitions for legislator-recipient crosswalk extraction."""
 
 from typing import Final
+from urllib.parse import urlparse
 
 import pyarrow as pa
 
@@ -13,9 +14,7 @@ HF_BASE_URL = "https://huggingface.co/datasets/Dustinhax/tyt/resolve/main"
 DIME_RECIPIENTS_URL = f"{HF_BASE_URL}/dime/recipients/dime_recipients_all_1979_2024.parquet"
 
 # Allowed domains for source URLs (SQL injection mitigation)
-ALLOWED_SOURCE_DOMAINS: Final[list[str]] = [
-    "huggingface.co",
-]
+ALLOWED_SOURCE_DOMAINS: Final[tuple[str, ...]] = ("huggingface.co",)
 
 # DIME stores ICPSR as "{icpsr}{year}" (e.g., "100751980" = ICPSR 10075 + year 1980)
 # We extract just the ICPSR portion by removing the last YEAR_SUFFIX_LENGTH characters
@@ -31,10 +30,8 @@ def validate_source_url(url: str) -> bool:
     Returns:
         True if URL is from an allowed domain
     """
-    from urllib.parse import urlparse
-
     parsed = urlparse(url)
-    return any(parsed.netloc.endswith(domain) for domain in ALLOWED_SOURCE_DOMAINS)
+    return parsed.netloc.endswith(ALLOWED_SOURCE_DOMAINS)
 
 
 # =============================================================================
@@ -0,0 +1 @@
+"""Tests for dime_converter module."""
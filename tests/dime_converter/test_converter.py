@@ -0,0 +1,34 @@
+"""Tests for DIME CSV to Parquet conversion."""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from scripts.dime_converter.converter import convert_dime_file
+from scripts.dime_converter.exceptions import SchemaValidationError
+from scripts.dime_converter.schema import FileType
+
+
+def write_csv_gz(path: Path, text: str) -> Path:
+    """Write text as a gzipped latin1 CSV file."""
+    with gzip.open(path, "wt", encoding="latin1") as f:
+        f.write(text)
+    return path
+
+
+class TestConvertDimeFile:
+    """Tests for convert_dime_file function."""
+
+    def test_missing_key_column_raises_schema_error(self, tmp_path: Path) -> None:
+        """A CSV without the expected columns should raise SchemaValidationError."""
+        source_path = write_csv_gz(
+            tmp_path / "dime_recipients.csv.gz",
+            'name,state\n"Jane Smith",CA\n"John Doe",NY\n',
+        )
+
+        with pytest.raises(SchemaValidationError) as exc_info:
+            convert_dime_file(source_path, tmp_path / "recipients.parquet", FileType.RECIPIENTS)
+
+        assert "bonica.rid" in exc_info.value.expected_columns
+        assert exc_info.value.actual_columns == ["name", "state"]
@@ -0,0 +1,29 @@
+"""Tests for DIME validators."""
+
+import gzip
+from pathlib import Path
+
+from scripts.dime_converter.validators import _read_csv_rows_at_indices
+
+
+class TestReadCsvRowsAtIndices:
+    """Tests for _read_csv_rows_at_indices function."""
+
+    def test_returns_sampled_rows_as_text(self, tmp_path: Path) -> None:
+        """Only the requested rows should come back, in sorted index order, as raw text."""
+        path = tmp_path / "sample.csv.gz"
+        with gzip.open(path, "wt", encoding="latin1") as f:
+            f.write("id,name\n")
+            for i in range(50_000):
+                f.write(f'{i},"name {i}"\n')
+
+        rows = _read_csv_rows_at_indices(path, [49_999, 3], ["id", "name"])
+
+        assert rows == [
+            {"id": "3", "name": "name 3"},
+            {"id": "49999", "name": "name 49999"},
+        ]
+
+    def test_empty_sample(self, tmp_path: Path) -> None:
+        """An empty sample should return without reading the file."""
+        assert _read_csv_rows_at_indices(tmp_path / "missing.csv.gz", [], ["id"]) == []